@@ -1,17 +1,31 @@
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
 import json
+import gzip
 import base64
 import time
 import functools
-from PySide6.QtCore import QObject, Signal
-from .constants import BASE_URL
-from utils.network_utils import get_mac_address, get_ip_address
-from utils.screenshot_utils import capture_screenshot
-from utils.screenshot_utils import check_screenshot_permission
+import concurrent.futures
+import tempfile
+from contextlib import ExitStack
+from collections import defaultdict
+from datetime import datetime
+from PySide6.QtCore import QObject, Signal, QRunnable, QThreadPool
+from .constants import (BASE_URL, API_CACHE_TTL_SECONDS, SYSTEM_INFO_TTL_SECONDS, SCREENSHOTS_DIR,
+                        GZIP_REQUEST_BODIES, GZIP_MIN_BYTES, DISK_CACHE_DIR, SCREENSHOT_MONITOR)
 import os
 
 import threading
 
+try:
+    import orjson  # optional, noticeably faster on large task lists
+except ImportError:
+    orjson = None
+
+# (connect, read) timeout in seconds for every API request
+DEFAULT_TIMEOUT = (3.05, 15)
+
 def with_retry(max_retries=3, delay=1.0, backoff=2.0, error_signal_name=None):
     """
     Decorator that implements retry logic for API calls.
@@ -72,6 +86,51 @@ def with_retry(max_retries=3, delay=1.0, backoff=2.0, error_signal_name=None):
         return wrapper
     return decorator
 
+def coalesce_inflight(func):
+    """
+    Decorator that lets concurrent identical calls share one execution.
+
+    A call made while the same method is already running with the same arguments waits for
+    that call and returns its result instead of sending a second request; its signals fire once.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = concurrent.futures.Future()
+        if not leader:
+            return future.result()
+        try:
+            result = func(self, *args, **kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    return wrapper
+
+class _ApiTask(QRunnable):
+    """Runnable that executes a blocking API call on the Qt thread pool"""
+
+    def __init__(self, func, *args, **kwargs):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        try:
+            self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            # Results are delivered through the APIService signals, so there is no caller to re-raise to
+            print(f"[APIService] Background API call failed: {str(e)}")
+
 class APIService(QObject):
     """Service to handle all API interactions with the backend (Singleton)"""
     
@@ -86,29 +145,72 @@ class APIService(QObject):
     tasks_loaded = Signal(list)
     tasks_error = Signal(str)
     projects_and_tasks_loaded = Signal(list)  # List of projects, each with their tasks
+    projects_and_tasks_grouped = Signal(object)  # The same tasks as {project_name: [tasks]}, sorted by project
     projects_and_tasks_error = Signal(str)
     timelog_posted = Signal(bool)
     timelog_error = Signal(str)
     screenshot_posted = Signal(bool)
     screenshot_error = Signal(str)
 
-    _instance = None
-    _lock = threading.Lock()
-
     def __init__(self):
         super().__init__()
         self.access_token = None
         self.refresh_token = None
         self.user_id = None
+        self._access_exp = None  # 'exp' claim of the access token, if it is a JWT
+        self._cache = {}  # url -> (time.monotonic() when stored, parsed JSON)
+        self._etags = {}  # url -> ETag of the cached payload, sent back as If-None-Match
+        self._grouped_tasks = (None, {})  # (task list, its group_by_project() result)
+        self._disk_cache_seeded = False  # the disk copy is only shown on the first fetch after login
+        self._screenshot_perm_reported = False  # permission is POSTed once per login
+        self._system_info_cache = {}  # name -> (time.monotonic() when stored, value)
+        self._refresh_lock = threading.Lock()
+        self._inflight = {}  # (method, args, kwargs) -> Future of a coalesced call still running
+        self._inflight_lock = threading.Lock()
+        self._last_refresh_ts = 0.0
+        self._capture_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
+        self._capture_slot = threading.BoundedSemaphore(1)  # held while a capture runs, so they never pile up
+        self._session = self._create_session()
+
+    @staticmethod
+    def _create_session():
+        """Create a pooled HTTP session shared by all API calls (keeps connections alive)"""
+        session = requests.Session()
+        # No adapter-level retries: with_retry on the API methods is the single retry layer
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+        )
+        scheme = BASE_URL.split("://", 1)[0]
+        session.mount(f"{scheme}://", adapter)
+        session.headers.update({
+            "User-Agent": "MercorTimeTracker/1.0",
+            "Accept": "application/json",
+            # requests decompresses these transparently via response.content / .json()
+            "Accept-Encoding": "gzip, deflate"
+        })
+        return session
 
     @classmethod
     def get_instance(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
+        """Return the shared instance, which is created once when this module is imported"""
+        return _SERVICE
     
+    def shutdown(self):
+        """Stop the screenshot capture threads and release their capture handles (call at app exit)"""
+        self._capture_pool.shutdown(wait=True, cancel_futures=True)
+        from utils.screenshot_utils import close_all_grabbers
+        close_all_grabbers()
+
+    def run_async(self, func, *args, **kwargs):
+        """
+        Run a blocking API method on the Qt thread pool instead of the GUI thread.
+
+        Results are delivered through the usual signals; Qt queues them back onto
+        the receivers' (GUI) thread, so slots stay thread-safe.
+        """
+        QThreadPool.globalInstance().start(_ApiTask(func, *args, **kwargs))
+
     def requires_auth(error_signal_name=None):
         """
         Decorator that ensures a method is only called when authenticated.
@@ -139,25 +241,29 @@ class APIService(QObject):
                 "password": password,
                 "mac_address": mac_address
             }
-            response = requests.post(url, json=payload)
+            response = self._session.post(url, json=payload, timeout=DEFAULT_TIMEOUT)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self._parse_json(response)
                 # Store tokens and user_id as per OpenAPI Token schema
                 self.access_token = data.get('access_token')
                 self.refresh_token = data.get('refresh_token')
                 self.user_id = data.get('employee_id') or data.get('user_id')
+                self._access_exp = self._decode_token_exp(self.access_token)
                 print("[APIService] Emitting auth_success with data:", data)
                 self.auth_success.emit(data)
+                # Report screenshot permission once per session, off the login path
+                self.run_async(self.check_screenshot_permission)
                 return True
             else:
-                try:
-                    error_msg = response.json().get('message', 'Authentication failed')
-                except Exception:
-                    error_msg = 'Authentication failed'
+                error_msg = self._extract_error(response, 'Authentication failed')
                 print("[APIService] Emitting auth_error with message:", error_msg)
                 self.auth_error.emit(error_msg)
                 return False
+        except requests.exceptions.Timeout:
+            print("[APIService] Emitting auth_error after server timeout")
+            self.auth_error.emit("Server timeout while logging in. Please try again.")
+            return False
         except Exception as e:
             print("[APIService] Emitting auth_error with exception:", str(e))
             self.auth_error.emit(f"Error connecting to server: {str(e)}")
@@ -170,10 +276,11 @@ class APIService(QObject):
             payload = {
                 "refresh_token": self.refresh_token
             }
-            response = requests.post(url, json=payload)
+            response = self._session.post(url, json=payload, timeout=DEFAULT_TIMEOUT)
             if response.status_code == 200:
-                data = response.json()
+                data = self._parse_json(response)
                 self.access_token = data.get('access_token')
+                self._access_exp = self._decode_token_exp(self.access_token)
                 return True
             else:
                 self.token_expired.emit()
@@ -187,36 +294,52 @@ class APIService(QObject):
         self.access_token = None
         self.refresh_token = None
         self.user_id = None
+        self._access_exp = None
+        self._screenshot_perm_reported = False
+        self._disk_cache_seeded = False
+        self.invalidate_cache()
         self.logout_success.emit()
         return True
     
+    @coalesce_inflight
     @requires_auth(error_signal_name="projects_error")
     @with_retry(max_retries=3, delay=1.0, backoff=2.0, error_signal_name="projects_and_tasks_error")
     def get_projects_and_tasks(self):
         """Fetch all projects and their tasks for the authenticated employee (GET /api/employees/projects)"""
         try:
             url = f"{BASE_URL}/api/employees/tasks"
-            headers = self._get_auth_headers()
-            response = requests.get(url, headers=headers)
+            cached = self._cached_get(url)
+            if cached is not None:
+                self._emit_projects_and_tasks(cached)
+                return cached
+            stale = self._load_disk_cache(url)
+            if stale is not None:
+                # Show the list saved by the last session right away; the request below revalidates it
+                self._emit_projects_and_tasks(stale)
+            response, data = self._get_revalidating(url)
+            if response is None:
+                return None
+            if data is not None:
+                self._emit_projects_and_tasks(data)
+                return data
             if response.status_code == 200:
-                data = response.json()
-                self.projects_and_tasks_loaded.emit(data)
+                data = self._parse_json(response)
+                self._store_cached(url, response, data)
+                self._save_disk_cache(url, data)
+                self._emit_projects_and_tasks(data)
                 return data
-            elif response.status_code == 401:
-                if self._handle_token_expiry():
-                    return self.get_projects_and_tasks()
-                return None
             else:
-                try:
-                    error_msg = response.json().get('message', 'Failed to fetch projects and tasks')
-                except Exception:
-                    error_msg = 'Failed to fetch projects and tasks'
+                error_msg = self._extract_error(response, 'Failed to fetch projects and tasks')
                 self.projects_and_tasks_error.emit(error_msg)
                 return None
+        except requests.exceptions.Timeout:
+            self.projects_and_tasks_error.emit("Server timeout while fetching projects and tasks")
+            return None
         except Exception as e:
             self.projects_and_tasks_error.emit(f"Error fetching projects and tasks: {str(e)}")
             return None
     
+    @coalesce_inflight
     @requires_auth(error_signal_name="tasks_error")
     @with_retry(max_retries=3, delay=1.0, backoff=2.0, error_signal_name="tasks_error")
     def get_tasks(self, project_id=None):
@@ -226,23 +349,28 @@ class APIService(QObject):
                 self.tasks_error.emit("No project selected")
                 return None
             url = f"{BASE_URL}/api/employees/projects"
-            headers = self._get_auth_headers()
-            response = requests.get(url, headers=headers)
+            cached = self._cached_get(url)
+            if cached is not None:
+                self.tasks_loaded.emit(cached)
+                return cached
+            response, data = self._get_revalidating(url)
+            if response is None:
+                return None
+            if data is not None:
+                self.tasks_loaded.emit(data)
+                return data
             if response.status_code == 200:
-                data = response.json()
+                data = self._parse_json(response)
+                self._store_cached(url, response, data)
                 self.tasks_loaded.emit(data)
                 return data
-            elif response.status_code == 401:
-                if self._handle_token_expiry():
-                    return self.get_tasks(project_id)
-                return None
             else:
-                try:
-                    error_msg = response.json().get('message', 'Failed to fetch tasks')
-                except Exception:
-                    error_msg = 'Failed to fetch tasks'
+                error_msg = self._extract_error(response, 'Failed to fetch tasks')
                 self.tasks_error.emit(error_msg)
                 return None
+        except requests.exceptions.Timeout:
+            self.tasks_error.emit("Server timeout while fetching tasks")
+            return None
         except Exception as e:
             self.tasks_error.emit(f"Error fetching tasks: {str(e)}")
             return None
@@ -257,135 +385,146 @@ class APIService(QObject):
         # convert start and end_time to epoch time if not already
         if isinstance(start_time, str):
             try:
-                start_time = int(time.mktime(time.strptime(start_time, '%Y-%m-%dT%H:%M:%S.%f')))
+                start_time = int(datetime.fromisoformat(start_time.replace('Z', '+00:00')).timestamp())
             except ValueError:
-                try:
-                    # Try alternative format without microseconds
-                    start_time = int(time.mktime(time.strptime(start_time, '%Y-%m-%dT%H:%M:%S')))
-                except ValueError:
-                    self.timelog_error.emit("Invalid start time format")
-                    return False
-                    
+                self.timelog_error.emit("Invalid start time format")
+                return False
+
         if isinstance(end_time, str):
             try:
-                end_time = int(time.mktime(time.strptime(end_time, '%Y-%m-%dT%H:%M:%S.%f')))
+                end_time = int(datetime.fromisoformat(end_time.replace('Z', '+00:00')).timestamp())
             except ValueError:
-                try:
-                    # Try alternative format without microseconds
-                    end_time = int(time.mktime(time.strptime(end_time, '%Y-%m-%dT%H:%M:%S')))
-                except ValueError:
-                    self.timelog_error.emit("Invalid end time format")
-                    return False
-                    
-        if isinstance(duration, str):
-            try:
-                duration = int(duration)
-            except ValueError:
-                self.timelog_error.emit("Invalid duration format")
+                self.timelog_error.emit("Invalid end time format")
                 return False
-                
-        if isinstance(duration, float):
-            duration = int(duration)    
+
+        try:
+            duration = int(duration)
+        except (TypeError, ValueError):
+            self.timelog_error.emit("Invalid duration format")
+            return False
+
         try:
             url = f"{BASE_URL}/api/timelogs/"
 
             # 2. Check screenshot permission
-            is_screenshot_permission_enabled = check_screenshot_permission()
-            screenshot_path = None
-
-            if is_screenshot_permission_enabled:
-                # 1. Capture screenshot
-                screenshot_path = capture_screenshot()
-                if not screenshot_path or not os.path.exists(screenshot_path):
-                    self.timelog_error.emit("Failed to capture screenshot.")
-                    return False
-            
-            # 3. Get network info
-            mac_addresses = get_mac_address()
-            mac_address = mac_addresses.get("primary", "")
-            ip_addresses = get_ip_address()
-            ip_address = ip_addresses.get("primary", "")
-
-            # 4. Prepare multipart/form-data payload
-            files = {}
-            if screenshot_path and os.path.exists(screenshot_path):
-                files = {
-                    'file': open(screenshot_path, 'rb')
+            is_screenshot_permission_enabled = self._cached_permission()
+
+            with ExitStack() as stack:
+                screenshot_path = None
+                capture = None
+                if is_screenshot_permission_enabled and not self._capture_slot.acquire(blocking=False):
+                    # An earlier capture (e.g. one that timed out) is still encoding; don't queue another.
+                    # The API has no "skipped" field, so report this timelog as one without screenshots
+                    # rather than as a permitted capture whose file went missing.
+                    print("[APIService] Previous screenshot still in progress, posting timelog without one")
+                    is_screenshot_permission_enabled = False
+                elif is_screenshot_permission_enabled:
+                    # 1. Capture screenshot to a unique file; it is removed however this block exits.
+                    # The capture runs in the background while the network info is gathered.
+                    try:
+                        screenshot_path = self._new_screenshot_path()
+                        stack.callback(self._remove_file, screenshot_path)
+                        from utils.screenshot_utils import capture_screenshot  # imports mss/Pillow on first use
+                        capture = self._capture_pool.submit(capture_screenshot, *os.path.split(screenshot_path),
+                                                          monitor=SCREENSHOT_MONITOR)
+                    except BaseException:
+                        self._capture_slot.release()
+                        raise
+                    capture.add_done_callback(lambda _: self._capture_slot.release())
+
+                # 3. Get network info
+                mac_address = self._cached_mac()
+                ip_address = self._cached_ip()
+
+                if capture is not None:
+                    try:
+                        captured = capture.result(timeout=10)
+                    except concurrent.futures.TimeoutError:
+                        # The capture may still write the file after we give up; remove it once it finishes
+                        capture.add_done_callback(lambda _: self._remove_file(screenshot_path))
+                        raise
+                    if not captured:
+                        self.timelog_error.emit("Failed to capture screenshot.")
+                        return False
+
+                # 4. Prepare multipart/form-data payload
+                data = {
+                    'task_id': task_id,
+                    'project_id': project_id,
+                    'start_time': start_time,
+                    'end_time': end_time,
+                    'duration': duration,
+                    'is_screenshot_permission_enabled': str(is_screenshot_permission_enabled),
+                    'ip_address': ip_address,
+                    'mac_address': mac_address
                 }
-                
-            data = {
-                'task_id': task_id,
-                'project_id': project_id,
-                'start_time': start_time,
-                'end_time': end_time,
-                'duration': duration,
-                'is_screenshot_permission_enabled': str(is_screenshot_permission_enabled),
-                'ip_address': ip_address,
-                'mac_address': mac_address
-            }
-            headers = {
-                'Authorization': f'Bearer {self.access_token}'
-            }
-            
-            response = requests.post(url, data=data, files=files, headers=headers)
+                fields = {key: str(value) for key, value in data.items() if value is not None}
+                screenshot_file = None
+                if screenshot_path:
+                    # Stream the image from disk in chunks instead of reading it into memory
+                    screenshot_file = stack.enter_context(open(screenshot_path, 'rb'))
+                    fields['file'] = (os.path.basename(screenshot_path), screenshot_file, 'image/png')
 
-            # 5. Clean up screenshot file
-            if screenshot_path and 'file' in files:
-                try:
-                    files['file'].close()
-                    os.remove(screenshot_path)
-                except Exception:
-                    pass
+                def build_body():
+                    # The encoder is consumed by each send, so rebuild it if the request is retried
+                    if screenshot_file is not None:
+                        screenshot_file.seek(0)
+                    encoder = MultipartEncoder(fields=fields)
+                    return {'data': encoder, 'headers': {'Content-Type': encoder.content_type}}
 
+                response = self._request_with_refresh('post', url, prepare=build_body)
+
+            if response is None:
+                return False
             if response.status_code in [200, 201]:
+                # Logged time changes the task totals, so cached task lists are stale now,
+                # including the copy on disk that the next login would show first
+                self.invalidate_cache()
+                self._drop_disk_cache()
                 self.timelog_posted.emit(True)
                 return True
-            elif response.status_code == 401:
-                if self._handle_token_expiry():
-                    return self.post_timelog_with_screenshot(task_id, project_id, start_time, end_time, duration)
-                return False
             else:
-                try:
-                    error_msg = response.json().get('message', 'Failed to post timelog with screenshot')
-                except Exception:
-                    error_msg = 'Failed to post timelog with screenshot'
+                error_msg = self._extract_error(response, 'Failed to post timelog with screenshot')
                 self.timelog_error.emit(error_msg)
                 return False
+        except requests.exceptions.Timeout:
+            self.timelog_error.emit("Server timeout while posting timelog")
+            return False
         except Exception as e:
             self.timelog_error.emit(f"Error posting timelog with screenshot: {str(e)}")
             return False
     
     @requires_auth(error_signal_name=None)
     def check_screenshot_permission(self):
-        """Send information about screenshot permission to the API"""
+        """Send information about screenshot permission to the API (once per login session)"""
+        if self._screenshot_perm_reported:
+            return True
         try:
             url = f"{BASE_URL}/api/permissions/screenshot"
             
-            # In a real app, you would actually check system permissions
-            # This is a placeholder - you need to implement the actual permission check
-            has_permission = True
-            
             payload = {
                 "user_id": self.user_id,
-                "has_permission": has_permission
+                "has_permission": bool(self._cached_permission())
             }
             
-            headers = self._get_auth_headers()
-            response = requests.post(url, json=payload, headers=headers)
-            
-            if response.status_code in [200, 201]:
-                return True
-            elif response.status_code == 401:
-                # Token might have expired
-                if self._handle_token_expiry():
-                    # Retry the request
-                    return self.check_screenshot_permission()
-                return False
-            else:
-                return False
+            response = self._request_with_refresh('post', url, json=payload, headers=self._get_auth_headers())
+            self._screenshot_perm_reported = response is not None and response.status_code in [200, 201]
+            return self._screenshot_perm_reported
         except:
             return False
     
+    @staticmethod
+    def _compress_json_body(request_kwargs):
+        """Replace a json= payload with a gzip-encoded body when it is larger than GZIP_MIN_BYTES"""
+        body = json.dumps(request_kwargs['json']).encode('utf-8')
+        if len(body) <= GZIP_MIN_BYTES:
+            return
+        del request_kwargs['json']
+        request_kwargs['data'] = gzip.compress(body)
+        request_kwargs['headers'] = {**request_kwargs['headers'],
+                                     'Content-Type': 'application/json',
+                                     'Content-Encoding': 'gzip'}
+
     def _get_auth_headers(self):
         """Helper method to get authorization headers"""
         return {
@@ -393,12 +532,250 @@ class APIService(QObject):
             "Content-Type": "application/json"
         }
     
+    def _request_with_refresh(self, method, url, prepare=None, **kwargs):
+        """
+        Send an authenticated request, refreshing the access token and retrying once on 401.
+
+        Args:
+            method: HTTP method name ('get', 'post', ...)
+            url: Request URL
+            prepare: Optional callable returning extra request kwargs. It is called for every
+                     attempt so one-shot bodies (e.g. streamed uploads) can be rebuilt.
+            **kwargs: Passed through to requests.Session.request
+
+        Returns:
+            The last response, or None if the access token could not be refreshed
+        """
+        response = None
+        for _ in range(2):
+            request_kwargs = dict(kwargs)
+            if prepare is not None:
+                extra = prepare()
+                request_kwargs['headers'] = {**(request_kwargs.get('headers') or {}), **extra.pop('headers', {})}
+                request_kwargs.update(extra)
+            # Always send the current token; it changes when the previous attempt triggered a refresh
+            request_kwargs['headers'] = {**(request_kwargs.get('headers') or {}),
+                                         'Authorization': f'Bearer {self.access_token}'}
+            request_kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+            if GZIP_REQUEST_BODIES and request_kwargs.get('json') is not None:
+                self._compress_json_body(request_kwargs)
+            response = self._session.request(method, url, **request_kwargs)
+            if response.status_code != 401:
+                return response
+            if not self._handle_token_expiry():
+                return None
+        return response
+
     def _ensure_authenticated(self):
-        """Check if user is authenticated (access token present)"""
-        return bool(self.access_token)
+        """Check if user is authenticated (access token present and not about to expire)"""
+        if not self.access_token:
+            return False
+        if self._access_exp is None or time.time() < self._access_exp - 30:
+            return True
+        # The token is known to be expired (or nearly so); refresh now instead of waiting for a 401
+        return self._handle_token_expiry()
+
+    @staticmethod
+    def _decode_token_exp(token):
+        """Return the 'exp' claim of a JWT, or None if the token cannot be decoded"""
+        try:
+            payload = token.split('.')[1]
+            payload += '=' * (-len(payload) % 4)
+            return json.loads(base64.urlsafe_b64decode(payload)).get('exp')
+        except Exception:
+            return None
+
+    @staticmethod
+    def group_by_project(tasks):
+        """Group a task list into {project_name: [tasks]}, ordered by project name"""
+        grouped = defaultdict(list)
+        for t in tasks or []:
+            grouped[t.get('project_name', 'Unnamed Project')].append(t)
+        return dict(sorted(grouped.items(), key=lambda item: str(item[0])))
+
+    def _emit_projects_and_tasks(self, data):
+        """Emit a task list as received and grouped by project; cache hits and 304s reuse the last grouping"""
+        self.projects_and_tasks_loaded.emit(data)
+        grouped_for, grouped = self._grouped_tasks
+        if grouped_for is not data:
+            grouped = self.group_by_project(data)
+            self._grouped_tasks = (data, grouped)
+        self.projects_and_tasks_grouped.emit(grouped)
+
+    def _cached_get(self, url, ttl=API_CACHE_TTL_SECONDS):
+        """Return the cached JSON for a GET url if it is younger than ttl seconds, else None"""
+        entry = self._cache.get(url)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+
+    @staticmethod
+    def _parse_json(response):
+        """Decode a JSON response body, using orjson when it is installed"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    def _extract_error(self, response, default):
+        """Return the 'message' field of an error response, or default if there is none"""
+        try:
+            return self._parse_json(response).get('message', default)
+        except Exception:
+            return default
+
+    def _conditional_headers(self, url):
+        """Auth headers plus If-None-Match when a cached copy of url has a stored ETag"""
+        headers = self._get_auth_headers()
+        etag = self._etags.get(url)
+        if etag and url in self._cache:
+            headers['If-None-Match'] = etag
+        return headers
+
+    def _store_cached(self, url, response, data):
+        """Cache a fresh GET payload along with its ETag, if the server sent one"""
+        self._cache[url] = (time.monotonic(), data)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etags[url] = etag
+        else:
+            self._etags.pop(url, None)
+
+    def _revalidated(self, url):
+        """Handle 304 Not Modified: restart the TTL of the cached payload and return it, or None if it is gone"""
+        entry = self._cache.get(url)
+        if entry is None:
+            # invalidate_cache() ran on another thread (timelog post, logout) while the request was in flight
+            return None
+        self._cache[url] = (time.monotonic(), entry[1])
+        return entry[1]
+
+    def _get_revalidating(self, url):
+        """
+        GET url, conditionally when a cached copy of it has an ETag.
+
+        Returns (response, data): data is the still-valid cached payload on a 304, else None.
+        If the cached copy was invalidated while the request was in flight, the 304 is
+        discarded and url is fetched again unconditionally.
+        """
+        response = self._request_with_refresh('get', url, headers=self._conditional_headers(url))
+        if response is not None and response.status_code == 304:
+            data = self._revalidated(url)
+            if data is not None:
+                return response, data
+            response = self._request_with_refresh('get', url, headers=self._get_auth_headers())
+        return response, None
+
+    def _disk_cache_path(self):
+        """File holding the current user's last task list"""
+        return os.path.join(DISK_CACHE_DIR, f"projects_cache_{self.user_id}.json")
+
+    def _load_disk_cache(self, url):
+        """
+        Seed the memory cache for url from the current user's disk cache and return the data, or None.
+
+        The entry is stored as already expired, so the caller still sends a conditional GET with the saved ETag.
+        Only the first fetch after login is seeded; later fetches that miss the memory cache were
+        invalidated on purpose, and the disk copy would bring back the data they dropped.
+        """
+        if self.user_id is None or url in self._cache or self._disk_cache_seeded:
+            return None
+        self._disk_cache_seeded = True
+        try:
+            with open(self._disk_cache_path(), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        data = entry.get('data') if isinstance(entry, dict) else None
+        if data is None:
+            return None
+        self._cache[url] = (float('-inf'), data)
+        if entry.get('etag'):
+            self._etags[url] = entry['etag']
+        return data
+
+    def _save_disk_cache(self, url, data):
+        """Write a fresh payload and its ETag to the current user's disk cache"""
+        if self.user_id is None:
+            return
+        try:
+            os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=DISK_CACHE_DIR, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'etag': self._etags.get(url), 'fetched_at': time.time(), 'data': data}, f)
+            # Replace in one step so a crash never leaves a half-written cache behind
+            os.replace(tmp_path, self._disk_cache_path())
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[APIService] Could not save the task list cache: {str(e)}")
+
+    def _drop_disk_cache(self):
+        """Delete the current user's disk cache, once the server-side data is known to have changed"""
+        if self.user_id is not None:
+            self._remove_file(self._disk_cache_path())
+
+    def invalidate_cache(self):
+        """Drop all cached GET responses and their ETags"""
+        self._cache.clear()
+        self._etags.clear()
+
+    def _cached_system_info(self, name, loader):
+        """Return a cached system lookup, re-running loader once it is older than SYSTEM_INFO_TTL_SECONDS"""
+        entry = self._system_info_cache.get(name)
+        if entry and time.monotonic() - entry[0] < SYSTEM_INFO_TTL_SECONDS:
+            return entry[1]
+        value = loader()
+        self._system_info_cache[name] = (time.monotonic(), value)
+        return value
+
+    def _cached_permission(self):
+        """Whether screenshots can be captured on this machine"""
+        from utils.screenshot_utils import check_screenshot_permission
+        # Probe on the capture pool: its threads live as long as the service, so the mss
+        # instance the probe opens is reused rather than left behind by an expiring pool thread
+        return self._cached_system_info(
+            'screenshot_permission', lambda: self._capture_pool.submit(check_screenshot_permission).result())
+
+    def _cached_mac(self):
+        """Primary MAC address of this machine"""
+        from utils.network_utils import get_mac_address
+        return self._cached_system_info('mac_address', lambda: get_mac_address().get("primary", ""))
+
+    def _cached_ip(self):
+        """Primary IP address of this machine"""
+        from utils.network_utils import get_ip_address
+        return self._cached_system_info('ip_address', lambda: get_ip_address().get("primary", ""))
+
+    @staticmethod
+    def _new_screenshot_path():
+        """Reserve a unique file in SCREENSHOTS_DIR for the next screenshot"""
+        os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(prefix='screenshot_', suffix='.png', dir=SCREENSHOTS_DIR, delete=False) as tmp:
+            return tmp.name
+
+    @staticmethod
+    def _remove_file(path):
+        """Delete a file, ignoring it if it is already gone"""
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def invalidate_network_cache(self):
+        """Forget the cached MAC/IP addresses, e.g. after the network configuration changed"""
+        self._system_info_cache.pop('mac_address', None)
+        self._system_info_cache.pop('ip_address', None)
 
     
     def _handle_token_expiry(self):
         """Handle token expiry by refreshing or signaling"""
-        # Always try to refresh the access token
-        return self.refresh_access_token()
\ No newline at end of file
+        # Serialize refreshes so concurrent 401s trigger a single /api/auth/refresh call;
+        # callers that waited on the lock reuse the token that was just obtained
+        with self._refresh_lock:
+            if time.monotonic() - self._last_refresh_ts < 5:
+                return True
+            refreshed = self.refresh_access_token()
+            if refreshed:
+                self._last_refresh_ts = time.monotonic()
+            return refreshed
+
+# Shared instance; built at import so get_instance() never has to lock or observe a half-built object
+_SERVICE = APIService()
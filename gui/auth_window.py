@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, 
                                QLineEdit, QPushButton, QMessageBox)
 from PySide6.QtCore import Signal, Qt
-from .styles import WINDOW_STYLE, TITLE_STYLE, TEXT_STYLE
+from .styles import INPUT_STYLE, get_style
 from .api_service import APIService
 from utils.network_utils import get_mac_address
 class AuthWindow(QWidget):
@@ -16,7 +16,7 @@ class AuthWindow(QWidget):
     def init_ui(self):
         self.setWindowTitle('Time Tracker – Login')
         self.setGeometry(300, 300, 420, 340)
-        self.setStyleSheet(WINDOW_STYLE)
+        self.setStyleSheet(get_style("WINDOW_STYLE"))
 
         layout = QVBoxLayout()
         layout.setSpacing(22)
@@ -24,70 +24,28 @@ class AuthWindow(QWidget):
 
         # Title
         title = QLabel('Welcome Back!')
-        title.setStyleSheet(TITLE_STYLE)
+        title.setStyleSheet(get_style("TITLE_STYLE"))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         # Username
         self.username_label = QLabel('Username')
-        self.username_label.setStyleSheet(TEXT_STYLE)
+        self.username_label.setStyleSheet(get_style("TEXT_STYLE"))
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText('Enter your username')
         self.username_input.setMinimumHeight(44)
-        self.username_input.setStyleSheet('''
-            QLineEdit {
-                background: white;
-                border: 2px solid #e5e7eb;
-                border-radius: 10px;
-                padding: 12px 16px;
-                font-size: 17px;
-                color: #1E293B;
-                font-family: 'Segoe UI', 'Inter', 'Arial', sans-serif;
-                transition: border 0.2s, box-shadow 0.2s;
-                box-shadow: 0 1px 4px 0 rgba(30,64,175,0.06);
-            }
-            QLineEdit:focus {
-                border: 2px solid #1E40AF;
-                box-shadow: 0 2px 8px 0 rgba(30,64,175,0.13);
-                outline: none;
-            }
-            QLineEdit::placeholder {
-                color: #94A3B8;
-                font-size: 16px;
-            }
-        ''')
+        self.username_input.setStyleSheet(INPUT_STYLE)
         layout.addWidget(self.username_label)
         layout.addWidget(self.username_input)
 
         # Password
         self.password_label = QLabel('Password')
-        self.password_label.setStyleSheet(TEXT_STYLE)
+        self.password_label.setStyleSheet(get_style("TEXT_STYLE"))
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText('Enter your password')
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.password_input.setMinimumHeight(44)
-        self.password_input.setStyleSheet('''
-            QLineEdit {
-                background: white;
-                border: 2px solid #e5e7eb;
-                border-radius: 10px;
-                padding: 12px 16px;
-                font-size: 17px;
-                color: #1E293B;
-                font-family: 'Segoe UI', 'Inter', 'Arial', sans-serif;
-                transition: border 0.2s, box-shadow 0.2s;
-                box-shadow: 0 1px 4px 0 rgba(30,64,175,0.06);
-            }
-            QLineEdit:focus {
-                border: 2px solid #1E40AF;
-                box-shadow: 0 2px 8px 0 rgba(30,64,175,0.13);
-                outline: none;
-            }
-            QLineEdit::placeholder {
-                color: #94A3B8;
-                font-size: 16px;
-            }
-        ''')
+        self.password_input.setStyleSheet(INPUT_STYLE)
         layout.addWidget(self.password_label)
         layout.addWidget(self.password_input)
 
@@ -112,6 +70,13 @@ class AuthWindow(QWidget):
         # Enter key in password field should trigger login
         self.password_input.returnPressed.connect(self.handle_login)
 
+    def reset(self):
+        """Clear the form so the window can be reused for the next login"""
+        self.username_input.clear()
+        self.password_input.clear()
+        self.login_button.setEnabled(True)
+        self.login_button.setText('Login')
+
     def handle_login(self):
         """Handler for login button click"""
         username = self.username_input.text()
@@ -125,6 +90,11 @@ class AuthWindow(QWidget):
         self.login_button.setEnabled(False)
         self.login_button.setText('Logging in...')
         
+        # Authenticate on the thread pool so the window keeps repainting during the request
+        self.api_service.run_async(self._authenticate, username, password)
+
+    def _authenticate(self, username, password):
+        """Worker-thread part of the login; results arrive through auth_success/auth_error"""
         # get mac address from the utils
         mac_address = get_mac_address()
         
@@ -1,11 +1,35 @@
 # constants.py
 # Central location for all application-wide constants
 
-BASE_URL = "https://mercortrialinsightfulapi.onrender.com"
+import os
+from dotenv import load_dotenv
 
-BASE_URL = "http://localhost:5000"
+# Allow MTT_* overrides from a local .env file (existing environment variables take precedence)
+load_dotenv()
+
+# Backend API; set MTT_BASE_URL=http://localhost:5000 for local development
+BASE_URL = os.environ.get("MTT_BASE_URL", "https://mercortrialinsightfulapi.onrender.com")
 
 # Interval (in seconds) between timelog API calls during active timing
-TIMELOG_INTERVAL_SECONDS = 20  # 5 minutes
+TIMELOG_INTERVAL_SECONDS = int(os.environ.get("MTT_INTERVAL", "300"))  # 5 minutes
+
+PROGRESS_BAR_FOR_SESSION = 3600 * 6  # 6 hours
+
+# How long (in seconds) GET responses such as the task list are served from memory
+API_CACHE_TTL_SECONDS = 60
+
+# How long (in seconds) screenshot permission and MAC/IP lookups are reused between timelog posts
+SYSTEM_INFO_TTL_SECONDS = 300
+
+# Gzip JSON request bodies larger than GZIP_MIN_BYTES; the backend must accept Content-Encoding: gzip
+GZIP_REQUEST_BODIES = os.environ.get("MTT_GZIP_REQUESTS", "0") == "1"
+GZIP_MIN_BYTES = 1024
+
+# The last task list of each user is kept here and shown at login while it is revalidated
+DISK_CACHE_DIR = os.environ.get("MTT_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".mercortt"))
+
+# Directory where screenshots are written before they are uploaded
+SCREENSHOTS_DIR = "screenshots"
 
-PROGRESS_BAR_FOR_SESSION = 3600 * 6  # 6 hours
\ No newline at end of file
+# Monitor captured for timelog screenshots: 1 is the primary display, 0 the whole virtual desktop
+SCREENSHOT_MONITOR = int(os.environ.get("MTT_SCREENSHOT_MONITOR", "1"))
@@ -1,196 +1,483 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton, QScrollArea, QFrame, QHBoxLayout, 
-                          QSpacerItem, QSizePolicy, QGridLayout)
-from PySide6.QtCore import Signal, Qt
-from functools import partial
-from .styles import OLIVE, WINDOW_STYLE, TITLE_STYLE, SUBTITLE_STYLE, TEXT_STYLE, PRIMARY, SECONDARY, TERTIARY, DARK_PRIMARY, LIGHT_PRIMARY, SUCCESS, WARNING, DANGER, INFO, WHITE, GRAY, DARK_GRAY, BLACK, CARD_STYLE, SHADOW
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout,
+                          QListView, QAbstractItemView, QStyledItemDelegate, QStyle)
+from PySide6.QtCore import (Signal, Qt, QAbstractListModel, QModelIndex, QRect, QSize, QPoint, QEvent, QObject,
+                            QRunnable, QThreadPool)
+from PySide6.QtGui import (QColor, QFont, QFontMetrics, QGuiApplication, QPainter, QPen, QPixmap,
+                           QPixmapCache, QStaticText, QTransform)
+import functools
+from contextlib import contextmanager
+import logging
+import sys
+from .styles import PRIMARY, SECONDARY, LIGHT_PRIMARY, WHITE
 from .api_service import APIService
 
-class TaskCard(QFrame):
-    """Custom widget for task cards to create a more modern UI"""
-    def __init__(self, task_data, on_track_clicked):
-        super().__init__()
-        self.task_data = task_data
-        self.on_track_clicked = on_track_clicked
-        self.init_ui()
-    
-    def init_ui(self):
-        from .styles import CARD_STYLE, PRIMARY, TEXT_STYLE
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {WHITE};
-                border-radius: 12px;
-                border: 1px solid {LIGHT_PRIMARY};
-                box-shadow: 0px 2px 6px rgba(0, 0, 0, 0.08);
-            }}
-            QFrame:hover {{
-                border: 1px solid {PRIMARY};
-                background-color: rgba(224, 231, 255, 0.2);
-            }}
-        """)
-        layout = QHBoxLayout()
-        layout.setSpacing(12)
-        layout.setContentsMargins(16, 12, 16, 12)
-
-        # Task info
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(4)
-
-        # Display task name
-        task_name = self.task_data.get('name', 'Unnamed Task')
-        task_label = QLabel(f"Task: {task_name}")
-        task_label.setStyleSheet(f"color: {PRIMARY}; font-weight: 700; font-size: 16px; letter-spacing: 0.3px;")
-        
-        # Time container
-        time_container = QHBoxLayout()
-        time_container.setSpacing(2)
-        
-        # Display hours if available or default to 0
-        mins = self.task_data.get('task_spent_time_in_minutes_real', 0)
-        
-        # Make sure mins is a whole number integer
-        if isinstance(mins, float):
-            mins = int(mins)
-        
-        # Format as HH:mm with whole numbers
-        hours = mins // 60
-        minutes = mins % 60
-        time_icon = QLabel("🕒")
-        time_icon.setStyleSheet(f"font-size: 12px; margin-right: 4px;")
-        time_label = QLabel(f"{int(hours):02d}:{int(minutes):02d}")
-        time_label.setStyleSheet(f"""
-            color: {SECONDARY}; 
-            font-size: 13px; 
-            font-weight: 500;
-            background-color: rgba(224, 231, 255, 0.4);
-            border-radius: 6px;
-            padding: 2px 6px;
-        """)
-        
-        time_container.addWidget(time_icon)
-        time_container.addWidget(time_label)
-        time_container.addStretch()
-        
-        info_layout.addWidget(task_label)
-        info_layout.addLayout(time_container)
-
-        # Track button
-        track_btn = QPushButton('Start')
-        track_btn.setFixedSize(70, 32)
-        track_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        track_btn.setStyleSheet(f'''
-            QPushButton {{
-                background-color: {PRIMARY};
-                color: {WHITE};
-                border: none;
-                border-radius: 6px;
-                padding: 4px;
-                font-size: 12px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {DARK_PRIMARY};
-                transform: translateY(-1px);
-            }}
-            QPushButton:pressed {{
-                background-color: {DARK_PRIMARY};
-                transform: translateY(1px);
-            }}
-        ''')
-        track_btn.clicked.connect(self.on_track_clicked)
-
-        layout.addLayout(info_layout, 1)
-        layout.addWidget(track_btn)
-        self.setLayout(layout)
-
-class ProjectTaskCard(QFrame):
-    """Custom widget for project cards with modern styling"""
-    def __init__(self, project_task_data, on_task_clicked):
+logger = logging.getLogger("dashboard_window")
+
+# Every row (project header or task) has the same height so QListView can lay out in O(1)
+ROW_HEIGHT = 76
+
+# Rows handed to the view at a time; the rest are added via fetchMore() as the user scrolls
+FETCH_BATCH_ROWS = 200
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_hhmm(mins):
+    """Format a minute count as HH:MM"""
+    return f"{mins // 60:02d}:{mins % 60:02d}"
+
+
+@functools.lru_cache(maxsize=256)
+def _task_count_label(n):
+    """'1 task' / 'N tasks' badge text"""
+    return f"{n} task{'s' if n != 1 else ''}"
+
+
+class Task:
+    """Compact record of the task fields the dashboard uses"""
+    __slots__ = ('id', 'name', 'project_id', 'project_name', 'minutes')
+
+    def __init__(self, data):
+        self.id = data.get('id')
+        self.name = data.get('name', 'Unnamed Task')
+        self.project_id = data.get('project_id')
+        project_name = data.get('project_name', 'Unnamed Project')
+        # The same project name repeats on every task of the project; keep a single copy
+        self.project_name = sys.intern(project_name) if isinstance(project_name, str) else project_name
+        self.minutes = int(data.get('task_spent_time_in_minutes_real') or 0)
+
+    def _fields(self):
+        return (self.id, self.name, self.project_id, self.project_name, self.minutes)
+
+    def matches(self, data):
+        """Whether this record already reflects the given API dict"""
+        return (self.name == data.get('name', 'Unnamed Task')
+                and self.minutes == int(data.get('task_spent_time_in_minutes_real') or 0)
+                and self.project_id == data.get('project_id')
+                and self.project_name == data.get('project_name', 'Unnamed Project'))
+
+    def __eq__(self, other):
+        return other is self or (isinstance(other, Task) and self._fields() == other._fields())
+
+    def __hash__(self):
+        return hash(self._fields())
+
+    def __repr__(self):
+        return f"Task(id={self.id!r}, name={self.name!r}, project={self.project_name!r})"
+
+
+def _flatten_groups(groups, expanded):
+    """
+    Flatten grouped tasks into (is_header, project_name, payload) rows.
+
+    Header payloads are (task_count, is_expanded); task rows exist only for expanded projects.
+    """
+    rows = []
+    append, extend = rows.append, rows.extend
+    for project, ts in groups:
+        is_expanded = project in expanded
+        append((True, project, (len(ts), is_expanded)))
+        if is_expanded:
+            extend([(False, project, t) for t in ts])
+    return rows
+
+
+def _row_key(row):
+    """Identity of a row: the project for headers, the project and task id for tasks"""
+    is_header, project_name, payload = row
+    if is_header:
+        return (True, project_name)
+    return (False, project_name, payload.id)
+
+
+def _fingerprint(grouped):
+    """Cheap hash of every field the dashboard shows, so any visible change forces a redraw"""
+    return hash(tuple((project, tuple((t.get('id'), t.get('name'), t.get('project_id'),
+                                       t.get('task_spent_time_in_minutes_real')) for t in ts))
+                      for project, ts in grouped.items()))
+
+
+class _TaskGrouperSignals(QObject):
+    """Delivers GroupTasksRunnable results back to the GUI thread"""
+    # epoch, fingerprint, Task records, (project_name, tasks) groups
+    grouped = Signal(int, object, object, object)
+
+
+class GroupTasksRunnable(QRunnable):
+    """Fingerprints and converts tasks already grouped by APIService into Task records on the thread pool"""
+    def __init__(self, grouped, epoch, signals, previous=None):
         super().__init__()
-        self.project_task_data = project_task_data
-        self.on_task_clicked = on_task_clicked
-        self.init_ui()
-    
-    def init_ui(self):
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {WHITE};
-                border-radius: 16px;
-                border: 1px solid rgba(99, 102, 241, 0.1);
-                box-shadow: 0px 4px 12px rgba(0, 0, 0, 0.08);
-            }}
-            QFrame:hover {{
-                box-shadow: 0px 6px 16px rgba(0, 0, 0, 0.12);
-            }}
-        """)
-        
-        layout = QVBoxLayout()
-        layout.setSpacing(12)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Project header with icon
-        header_layout = QHBoxLayout()
-        
-        # Project icon
-        icon_label = QLabel("📂")
-        icon_label.setStyleSheet("font-size: 20px; margin-right: 8px;")
-        
-        # Get project name or use 'Unnamed Project' as fallback
-        project_name = self.project_task_data[0]
-        project_title = QLabel(f"Project: {project_name}")
-        project_title.setStyleSheet(f"""
-            font-size: 20px;
-            font-weight: 800;
-            color: {PRIMARY};
-            letter-spacing: 0.5px;
-        """)
-        
-        header_layout.addWidget(icon_label)
-        header_layout.addWidget(project_title)
-        header_layout.addStretch(1)
-        
-        # Add task count badge
-        tasks = self.project_task_data[1]
-        task_count = len(tasks) if tasks else 0
-        task_count_label = QLabel(f"{task_count} task{'s' if task_count != 1 else ''}")
-        task_count_label.setStyleSheet(f"""
-            background-color: {LIGHT_PRIMARY};
-            color: {PRIMARY};
-            border-radius: 10px;
-            padding: 4px 10px;
-            font-size: 13px;
-            font-weight: 600;
-        """)
-        header_layout.addWidget(task_count_label)
-        
-        layout.addLayout(header_layout)
-        
-        # Add separator line
-        separator = QFrame()
-        separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet(f"background-color: rgba(99, 102, 241, 0.1); margin: 4px 0px 8px 0px; min-height: 1px; max-height: 1px;")
-        layout.addWidget(separator)
-        
-        # Tasks
-        if tasks:
-            tasks_container = QVBoxLayout()
-            tasks_container.setSpacing(8)
-            
-            for task in tasks:
-                task_card = TaskCard(
-                    task, 
-                    partial(self.on_task_clicked, self.project_task_data, task)
-                )
-                tasks_container.addWidget(task_card)
-                
-            layout.addLayout(tasks_container)
+        self.grouped = grouped
+        self.epoch = epoch
+        self.signals = signals
+        self.previous = previous or {}  # task id -> Task currently on screen, reused when unchanged
+
+    def run(self):
+        try:
+            previous = self.previous
+            records = []
+            groups = []
+            for project, ts in self.grouped.items():
+                group = []
+                append = group.append
+                for t in ts:
+                    task = previous.get(t.get('id'))
+                    append(task if task is not None and task.matches(t) else Task(t))
+                groups.append((project, group))
+                records.extend(group)
+            self.signals.grouped.emit(self.epoch, _fingerprint(self.grouped), records, groups)
+        except Exception as e:
+            print(f"Error grouping tasks: {e}")
+
+
+class TaskListModel(QAbstractListModel):
+    """Flat list model of project header rows, each followed by its task rows while expanded"""
+    IsHeaderRole = Qt.ItemDataRole.UserRole + 1
+    ProjectNameRole = Qt.ItemDataRole.UserRole + 2
+    TaskNameRole = Qt.ItemDataRole.UserRole + 3
+    MinutesRole = Qt.ItemDataRole.UserRole + 4
+    TaskCountRole = Qt.ItemDataRole.UserRole + 5
+    TaskRole = Qt.ItemDataRole.UserRole + 6
+    ExpandedRole = Qt.ItemDataRole.UserRole + 7
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._pending = []  # rows not yet exposed to the view (see fetchMore)
+        self._groups = []
+        self._expanded = set()  # projects whose task rows are shown; all start collapsed
+
+    def set_groups(self, groups):
+        """Show the given (project_name, tasks) groups, keeping each project's expanded state"""
+        self._groups = groups
+        self.set_rows(_flatten_groups(groups, self._expanded))
+
+    def toggle_project(self, project_name):
+        """Expand or collapse a project; its task rows are only created while it is expanded"""
+        if project_name in self._expanded:
+            self._expanded.discard(project_name)
         else:
-            # Show message if no tasks
-            no_tasks = QLabel("No tasks assigned to this project")
-            no_tasks.setStyleSheet(f"color: {DARK_GRAY}; font-style: italic; padding: 10px;")
-            no_tasks.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(no_tasks)
-        
-        self.setLayout(layout)
+            self._expanded.add(project_name)
+        self.set_rows(_flatten_groups(self._groups, self._expanded))
+
+    def set_rows(self, all_rows):
+        """
+        Replace the rows with the given rows, as built by _flatten_groups.
+
+        Instead of resetting the model, only the rows that actually changed are removed,
+        inserted or repainted, so the view keeps its scroll position and untouched rows.
+        """
+        old_rows = self._rows
+        # Keep as many rows loaded as the user has already scrolled through, at least one batch
+        visible = max(len(old_rows), FETCH_BATCH_ROWS)
+        new_rows, self._pending = all_rows[:visible], all_rows[visible:]
+        old_keys = [_row_key(row) for row in old_rows]
+        new_keys = [_row_key(row) for row in new_rows]
+
+        # Rows matching by identity at the start and the end are kept in place
+        limit = min(len(old_keys), len(new_keys))
+        prefix = 0
+        while prefix < limit and old_keys[prefix] == new_keys[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old_keys[-1 - suffix] == new_keys[-1 - suffix]:
+            suffix += 1
+
+        # Swap the differing middle block
+        old_end = len(old_rows) - suffix
+        new_end = len(new_rows) - suffix
+        if old_end > prefix:
+            self.beginRemoveRows(QModelIndex(), prefix, old_end - 1)
+            self._rows = old_rows[:prefix] + old_rows[old_end:]
+            self.endRemoveRows()
+        if new_end > prefix:
+            self.beginInsertRows(QModelIndex(), prefix, new_end - 1)
+            self._rows = self._rows[:prefix] + new_rows[prefix:new_end] + self._rows[prefix:]
+            self.endInsertRows()
+
+        # Kept rows may still carry new names, times or counts
+        self._rows = new_rows
+        make_index, emit_changed = self.index, self.dataChanged.emit
+        shift = old_end - new_end
+        for row in list(range(prefix)) + list(range(new_end, len(new_rows))):
+            old_row = old_rows[row if row < prefix else row + shift]
+            if old_row[2] != new_rows[row][2]:
+                index = make_index(row)
+                emit_changed(index, index)
+
+    def task_at(self, row):
+        """(project_name, Task) for a task row, or None for a header row"""
+        is_header, project_name, payload = self._rows[row]
+        return None if is_header else (project_name, payload)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and bool(self._pending)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._pending:
+            return
+        batch, self._pending = self._pending[:FETCH_BATCH_ROWS], self._pending[FETCH_BATCH_ROWS:]
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(batch) - 1)
+        self._rows = self._rows + batch
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        is_header, project_name, payload = self._rows[index.row()]
+        if role == self.IsHeaderRole:
+            return is_header
+        if role == self.ProjectNameRole:
+            return project_name
+        if is_header:
+            if role == self.TaskCountRole:
+                return payload[0]
+            if role == self.ExpandedRole:
+                return payload[1]
+            if role == Qt.ItemDataRole.DisplayRole:
+                return f"Project: {project_name}"
+            return None
+        if role == self.TaskRole:
+            return payload
+        if role in (self.TaskNameRole, Qt.ItemDataRole.DisplayRole):
+            return payload.name
+        if role == self.MinutesRole:
+            return payload.minutes
+        return None
+
+
+def _font(pixel_size, weight=QFont.Weight.Normal, letter_spacing=0.0):
+    font = QFont('Segoe UI')
+    font.setPixelSize(pixel_size)
+    font.setWeight(weight)
+    if letter_spacing:
+        font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, letter_spacing)
+    return font
+
+
+def _static_text(text, font):
+    static = QStaticText(text)
+    static.setTextFormat(Qt.TextFormat.PlainText)
+    static.prepare(QTransform(), font)
+    return static
+
+
+def _glyph_pixmap(glyph, font):
+    """Emoji glyph rasterized once and served from QPixmapCache, so rows blit instead of shaping text"""
+    screen = QGuiApplication.primaryScreen()
+    ratio = screen.devicePixelRatio() if screen else 1.0
+    key = f"mtt-glyph:{glyph}:{font.pixelSize()}:{ratio}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+
+    metrics = QFontMetrics(font)
+    size = QSize(metrics.horizontalAdvance(glyph), metrics.height())
+    pixmap = QPixmap(size * ratio)
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.drawText(QRect(QPoint(0, 0), size), Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class _PaintResources:
+    """Fonts, pens, colours and pre-laid-out text shared by every dashboard row"""
+    def __init__(self):
+        self.header_font = _font(20, QFont.Weight.ExtraBold, 0.5)
+        self.badge_font = _font(13, QFont.Weight.DemiBold)
+        self.name_font = _font(16, QFont.Weight.Bold, 0.3)
+        self.time_font = _font(13, QFont.Weight.Medium)
+        self.icon_font = _font(12)
+        self.button_font = _font(12, QFont.Weight.DemiBold)
+
+        self.primary_pen = QPen(QColor(PRIMARY))
+        self.secondary_pen = QPen(QColor(SECONDARY))
+        self.white_pen = QPen(QColor(WHITE))
+        self.border_pen = QPen(QColor(LIGHT_PRIMARY))
+        self.hover_border_pen = QPen(QColor(PRIMARY))
+        self.separator_pen = QPen(QColor(99, 102, 241, 26))
+
+        self.card_color = QColor(WHITE)
+        self.hover_color = QColor(224, 231, 255, 51)
+        self.badge_color = QColor(LIGHT_PRIMARY)
+        self.time_color = QColor(224, 231, 255, 102)
+        self.button_color = QColor(PRIMARY)
+
+        # Text that never changes is laid out once
+        self.start_text = _static_text("Start", self.button_font)
+
+
+@functools.lru_cache(maxsize=None)
+def _paint_resources():
+    """Build the shared paint resources on first use (Qt needs a QGuiApplication by then)"""
+    return _PaintResources()
+
+
+@functools.lru_cache(maxsize=4096)
+def _time_text(minutes):
+    """Laid-out HH:MM text for a minute count; the same few values repeat across rows"""
+    return _static_text(_fmt_hhmm(minutes), _paint_resources().time_font)
+
+
+class TaskDelegate(QStyledItemDelegate):
+    """Paints project headers and task cards directly, so rows need no child widgets"""
+    # Emitted when the painted Start pill of a task row is clicked
+    taskActivated = Signal(QModelIndex)
+    # Emitted when a project header row is clicked (expand/collapse)
+    headerActivated = Signal(QModelIndex)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._res = _paint_resources()
+
+    @staticmethod
+    def _draw_centered(painter, rect, static):
+        size = static.size()
+        painter.drawStaticText(QPoint(rect.left() + int((rect.width() - size.width()) / 2),
+                                      rect.top() + int((rect.height() - size.height()) / 2)), static)
+
+    @staticmethod
+    def _card_rect(row_rect):
+        return row_rect.adjusted(0, 4, -1, -4)
+
+    @classmethod
+    def _button_rect(cls, row_rect):
+        """Where the Start pill of a task row is painted (and hit-tested)"""
+        inner = cls._card_rect(row_rect).adjusted(16, 8, -16, -8)
+        return QRect(inner.right() - 70, inner.center().y() - 16, 70, 32)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            if index.data(TaskListModel.IsHeaderRole):
+                self.headerActivated.emit(index)
+                return True
+            if self._button_rect(option.rect).contains(event.position().toPoint()):
+                self.taskActivated.emit(index)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if index.data(TaskListModel.IsHeaderRole):
+            self._paint_header(painter, option.rect, index)
+        else:
+            self._paint_task(painter, option, index)
+        painter.restore()
+
+    def _paint_header(self, painter, rect, index):
+        """Project title on the left, task-count badge on the right, separator underneath"""
+        rect = rect.adjusted(4, 16, -4, -4)
+        badge_text = _task_count_label(index.data(TaskListModel.TaskCountRole))
+
+        painter.setFont(self._res.badge_font)
+        badge_width = painter.fontMetrics().horizontalAdvance(badge_text) + 20
+        badge = QRect(rect.right() - badge_width, rect.center().y() - 12, badge_width, 24)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._res.badge_color)
+        painter.drawRoundedRect(badge, 10, 10)
+        painter.setPen(self._res.primary_pen)
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, badge_text)
+
+        # Expand/collapse chevron
+        painter.setFont(self._res.header_font)
+        chevron = "▾" if index.data(TaskListModel.ExpandedRole) else "▸"
+        chevron_rect = QRect(rect.left(), rect.top(), 20, rect.height())
+        painter.drawText(chevron_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, chevron)
+
+        folder = _glyph_pixmap("📂", self._res.header_font)
+        folder_size = folder.deviceIndependentSize().toSize()
+        painter.drawPixmap(chevron_rect.right() + 4, rect.center().y() - folder_size.height() // 2, folder)
+
+        title_left = chevron_rect.right() + 4 + folder_size.width() + 8
+        title_rect = QRect(title_left, rect.top(), badge.left() - title_left - 8, rect.height())
+        title = painter.fontMetrics().elidedText(
+            f"Project: {index.data(TaskListModel.ProjectNameRole)}",
+            Qt.TextElideMode.ElideRight, title_rect.width())
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+
+        painter.setPen(self._res.separator_pen)
+        painter.drawLine(rect.left(), rect.bottom(), rect.right(), rect.bottom())
+
+    def _paint_task(self, painter, option, index):
+        """Rounded card with the task name, time spent and a Start pill"""
+        rect = self._card_rect(option.rect)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setPen(self._res.hover_border_pen if hovered else self._res.border_pen)
+        painter.setBrush(self._res.card_color)
+        painter.drawRoundedRect(rect, 12, 12)
+        if hovered:
+            painter.setBrush(self._res.hover_color)
+            painter.drawRoundedRect(rect, 12, 12)
+
+        inner = rect.adjusted(16, 8, -16, -8)
+
+        # Start pill
+        button = self._button_rect(option.rect)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._res.button_color)
+        painter.drawRoundedRect(button, 6, 6)
+        painter.setFont(self._res.button_font)
+        painter.setPen(self._res.white_pen)
+        self._draw_centered(painter, button, self._res.start_text)
+
+        # Task name on the top half
+        text_width = button.left() - inner.left() - 12
+        half = inner.height() // 2
+        name_rect = QRect(inner.left(), inner.top(), text_width, half)
+        painter.setFont(self._res.name_font)
+        painter.setPen(self._res.primary_pen)
+        name = painter.fontMetrics().elidedText(
+            f"Task: {index.data(TaskListModel.TaskNameRole)}", Qt.TextElideMode.ElideRight, text_width)
+        painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
+
+        # Clock glyph and HH:MM pill on the bottom half
+        clock = _glyph_pixmap("🕒", self._res.icon_font)
+        clock_size = clock.deviceIndependentSize().toSize()
+        icon_rect = QRect(inner.left(), inner.top() + half, clock_size.width() + 4, inner.height() - half)
+        painter.drawPixmap(icon_rect.left(), icon_rect.center().y() - clock_size.height() // 2, clock)
+
+        time_text = _time_text(index.data(TaskListModel.MinutesRole))
+        painter.setFont(self._res.time_font)
+        pill = QRect(icon_rect.right() + 2, icon_rect.center().y() - 10, int(time_text.size().width()) + 12, 20)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._res.time_color)
+        painter.drawRoundedRect(pill, 6, 6)
+        painter.setPen(self._res.secondary_pen)
+        self._draw_centered(painter, pill, time_text)
+
+
+class _UnderlinedLabel(QLabel):
+    """QLabel that paints its own decorative underline instead of needing a separate QFrame"""
+    UNDERLINE_HEIGHT = 3
+    UNDERLINE_INSET = 200
+
+    def __init__(self, text, parent=None):
+        super().__init__(text, parent)
+        self._underline_color = QColor(WHITE)
+        self.setContentsMargins(0, 0, 0, self.UNDERLINE_HEIGHT + 2)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._underline_color)
+        inset = min(self.UNDERLINE_INSET, self.width() // 4)
+        painter.drawRoundedRect(QRect(inset, self.height() - self.UNDERLINE_HEIGHT,
+                                      self.width() - 2 * inset, self.UNDERLINE_HEIGHT), 1, 1)
+        painter.end()
+
 
 class DashboardWindow(QWidget):
     task_clicked = Signal(dict)
@@ -198,19 +485,48 @@ class DashboardWindow(QWidget):
     def __init__(self, projects=None, api_service=None):
         super().__init__()
         self.api_service = api_service or APIService.get_instance()
-        self.tasks = projects or []
+        self.tasks = [Task(t) for t in projects or []]
+        self._last_tasks_hash = None  # fingerprint of the payload currently shown
+        self._tasks_by_id = {t.id: t for t in self.tasks if t.id is not None}
+        # Grouping runs on the thread pool; only the result of the latest request is applied
+        self._group_epoch = 0
+        self._grouper = _TaskGrouperSignals(self)
+        self._grouper.grouped.connect(self._apply_grouped, Qt.ConnectionType.QueuedConnection)
         self.init_ui()
         self.setup_connections()
 
     def setup_connections(self):
         """Set up signal connections for API service"""
-        # Connect signals from API service
-        self.api_service.projects_and_tasks_loaded.connect(self.update_tasks)
-        self.api_service.projects_and_tasks_error.connect(self.handle_api_error)
+        # The API signals are only connected while the dashboard is visible (see showEvent/hideEvent),
+        # so refreshes made for other windows don't rebuild it in the background
+        self._api_connected = False
+
+    def _connect_api(self, connected):
+        """Connect or disconnect the task list slots from the API service signals"""
+        if connected == self._api_connected:
+            return
+        self._api_connected = connected
+        if connected:
+            # Emitted from the thread pool (APIService.run_async), so the slots must be queued onto the GUI thread
+            self.api_service.projects_and_tasks_grouped.connect(self.update_tasks, Qt.ConnectionType.QueuedConnection)
+            self.api_service.projects_and_tasks_error.connect(self.handle_api_error, Qt.ConnectionType.QueuedConnection)
+        else:
+            self.api_service.projects_and_tasks_grouped.disconnect(self.update_tasks)
+            self.api_service.projects_and_tasks_error.disconnect(self.handle_api_error)
+
+    def showEvent(self, event):
+        self._connect_api(True)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # Spontaneous hides come from minimizing the main window; keep listening so a fetch in flight still lands
+        if not event.spontaneous():
+            self._connect_api(False)
+        super().hideEvent(event)
 
     def init_ui(self):
         self.setWindowTitle('Time Tracker - Dashboard')
-        self.setStyleSheet(WINDOW_STYLE)
+        # Styled by GLOBAL_STYLE on MainWindow through the object names below
         
         main_layout = QVBoxLayout()
         main_layout.setSpacing(20)
@@ -218,36 +534,19 @@ class DashboardWindow(QWidget):
 
         # Header Bar with shadow effect
         header = QFrame()
-        header.setStyleSheet(f"""
-            background: {LIGHT_PRIMARY}; 
-            border-bottom-left-radius: 20px; 
-            border-bottom-right-radius: 20px;
-            box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.2);
-        """)
+        header.setObjectName("dashboardHeader")
         header.setMinimumHeight(80)
         
         header_layout = QHBoxLayout()
         header_layout.setContentsMargins(30, 15, 30, 15)
         
         logo = QLabel("🕒 Time Tracker")
-        logo.setStyleSheet(f"""
-            color: {PRIMARY}; 
-            font-size: 28px; 
-            font-weight: bold;
-            letter-spacing: 0.8px;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.2);
-        """)
+        logo.setObjectName("dashboardLogo")
         header_layout.addWidget(logo)
-        header_layout.addSpacerItem(QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
+        header_layout.addStretch()
         
         user = QLabel("👤 User")
-        user.setStyleSheet(f"""
-            color: {PRIMARY}; 
-            font-size: 18px;
-            background-color: rgba(255, 255, 255, 0.2);
-            padding: 6px 12px;
-            border-radius: 15px;
-        """)
+        user.setObjectName("dashboardUser")
         header_layout.addWidget(user)
         
         header.setLayout(header_layout)
@@ -255,141 +554,128 @@ class DashboardWindow(QWidget):
 
         # Title with decorative underline
         title_container = QVBoxLayout()
-        title = QLabel('My Tasks')
-        title.setStyleSheet(f"""
-            {TITLE_STYLE}
-            padding-bottom: 5px;
-            text-shadow: 1px 1px 3px rgba(0, 0, 0, 0.1);
-            letter-spacing: 0.8px;
-        """)
+        title = _UnderlinedLabel('My Tasks')
+        title.setObjectName("dashboardTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        # Add decorative line under title
-        underline = QFrame()
-        underline.setFrameShape(QFrame.Shape.HLine)
-        underline.setStyleSheet(f"background-color: {WHITE}; min-height: 3px; max-height: 3px; border-radius: 1px; margin-left: 200px; margin-right: 200px;")
-        
         title_container.addWidget(title)
-        title_container.addWidget(underline)
         title_container.addSpacing(10)
         main_layout.addLayout(title_container)
 
-        # Project Cards Area
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet(f"border: none; background-color: transparent;")
-        
-        self.scroll_content = QWidget()
-        self.scroll_layout = QVBoxLayout()
-        self.scroll_layout.setSpacing(20)
-        self.scroll_layout.setContentsMargins(30, 10, 30, 30)
-
-        # Add loading message initially
-        self.loading_label = QLabel("Loading tasks...")
-        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.loading_label.setStyleSheet(f"color: {OLIVE}; font-size: 18px; margin: 50px 0;")
-        self.scroll_layout.addWidget(self.loading_label)
-        
-        # Add some space at the bottom
-        self.scroll_layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
-        
-        self.scroll_content.setLayout(self.scroll_layout)
-        self.scroll.setWidget(self.scroll_content)
-        main_layout.addWidget(self.scroll)
+        # Project/task list; only the visible rows are painted
+        list_layout = QVBoxLayout()
+        list_layout.setContentsMargins(30, 10, 30, 30)
+
+        # Loading / empty / error message, shown in place of the list
+        self.message_label = QLabel("Loading tasks...")
+        self.message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.message_label.setObjectName("dashboardMessage")
+        list_layout.addWidget(self.message_label)
+
+        self.task_model = TaskListModel(self)
+        self.task_view = QListView()
+        self.task_view.setModel(self.task_model)
+        self.task_delegate = TaskDelegate(self.task_view)
+        self.task_delegate.taskActivated.connect(self.handle_task_click)
+        self.task_delegate.headerActivated.connect(self.handle_header_click)
+        self.task_view.setItemDelegate(self.task_delegate)
+        self.task_view.setUniformItemSizes(True)
+        # Lay out rows in batches so a large insert never stalls the event loop
+        self.task_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.task_view.setBatchSize(FETCH_BATCH_ROWS)
+        self.task_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.task_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.task_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.task_view.setMouseTracking(True)
+        self.task_view.setObjectName("taskList")
+        self.task_view.hide()
+        list_layout.addWidget(self.task_view, 1)
+        list_layout.addStretch()
+
+        main_layout.addLayout(list_layout, 1)
         
         self.setLayout(main_layout)
 
-    def handle_task_click(self, task_proj_tuple, task):
-        """Handle when a task card is clicked"""
-        print(f"Task clicked: {task}")
-        print(f"Project: {task_proj_tuple}")
+    @contextmanager
+    def _batched_updates(self):
+        """Suspend painting so row changes and the message/list swap land in a single repaint"""
+        if not self.updatesEnabled():
+            yield  # already inside a batch
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _show_message(self, text, state=""):
+        """Replace the task list with a centered message ("error" state shows it in red)"""
+        self.message_label.setText(text)
+        if self.message_label.property("state") != state:
+            self.message_label.setProperty("state", state)
+            # Re-evaluate the [state="error"] selector for the new property value
+            self.message_label.style().unpolish(self.message_label)
+            self.message_label.style().polish(self.message_label)
+        self.task_view.hide()
+        self.message_label.show()
+
+    def handle_task_click(self, index):
+        """Handle when the Start pill of a task row is clicked (project header rows are ignored)"""
+        # Read the row directly instead of round-tripping the Task through data()
+        entry = self.task_model.task_at(index.row())
+        if entry is None:
+            return
+        project_name, task = entry
         task_data = {
-            'project_id': task.get('project_id'),
-            'project_name': task.get('project_name'),
-            'task_id': task.get('id'),
-            'task_name': task.get('name', 'Unknown Task')
+            'project_id': task.project_id,
+            'project_name': task.project_name,
+            'task_id': task.id,
+            'task_name': task.name
         }
-        print(f"Task clicked: {task_data}")
+        logger.debug("Task clicked: %s", task_data)
         self.task_clicked.emit(task_data)
 
-    def update_tasks(self, tasks):
-        """Update the dashboard with the real projects and tasks data from API"""
-        print(f"Updating dashboard with {len(tasks)} tasks")
+    def handle_header_click(self, index):
+        """Expand or collapse the clicked project"""
+        self.task_model.toggle_project(index.data(TaskListModel.ProjectNameRole))
+
+    def update_tasks(self, grouped):
+        """Update the dashboard with the tasks from the API, already grouped as {project_name: [tasks]}"""
+        logger.debug("Updating dashboard with %d projects", len(grouped))
+        # Converting to Task records is plain Python work; keep it off the GUI thread
+        self._group_epoch += 1
+        QThreadPool.globalInstance().start(
+            GroupTasksRunnable(grouped, self._group_epoch, self._grouper, self._tasks_by_id))
+
+    def _apply_grouped(self, epoch, fingerprint, tasks, groups):
+        """Show a grouped task list produced by GroupTasksRunnable"""
+        if epoch != self._group_epoch:
+            return  # a newer update or an error arrived meanwhile
+        # Polls usually return the same list; skip all work when nothing visible changed
+        if fingerprint == self._last_tasks_hash:
+            return
         self.tasks = tasks
+        self._tasks_by_id = {t.id: t for t in tasks if t.id is not None}
         
-        # Clear existing widgets
-        for i in reversed(range(self.scroll_layout.count())):
-            widget = self.scroll_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.deleteLater()
-        
-        if not tasks:
-            # Show message if no projects/tasks
-            no_tasks = QLabel("No tasks assigned to you")
-            no_tasks.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_tasks.setStyleSheet(f"color: {OLIVE}; font-size: 18px; margin: 50px 0;")
-            self.scroll_layout.addWidget(no_tasks)
-        else:
-            # Add project cards with real data
-            proj_ts = {}
-            for t in tasks:
-                project_name = t.get('project_name', 'Unnamed Project')
-                if project_name not in proj_ts:
-                    proj_ts[project_name] = []
-                proj_ts[project_name].append(t)
-                
-            for project, ts in proj_ts.items():
-                # Create a project card with the tasks
-                project_card = ProjectTaskCard((project, ts), self.handle_task_click)
-                self.scroll_layout.addWidget(project_card)
-        
-        # Add spacer at the bottom
-        self.scroll_layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
+        with self._batched_updates():
+            self.task_model.set_groups(groups)
+            
+            if not tasks:
+                # Show message if no projects/tasks
+                self._show_message("No tasks assigned to you")
+            else:
+                self.message_label.hide()
+                self.task_view.show()
+        self._last_tasks_hash = fingerprint
 
     def handle_api_error(self, error_msg):
         """Handle API errors"""
-        # Show error message
-        error_label = QLabel(f"Error loading tasks: {error_msg}")
-        error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        error_label.setStyleSheet("color: red; font-size: 16px; margin: 50px 0;")
-        
-        # Clear existing widgets
-        for i in reversed(range(self.scroll_layout.count())):
-            widget = self.scroll_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.deleteLater()
-                
-        self.scroll_layout.addWidget(error_label)
-        self.scroll_layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
+        # Show error message; the next successful load must redraw the list
+        self._group_epoch += 1
+        self._last_tasks_hash = None
+        with self._batched_updates():
+            self._show_message(f"Error loading tasks: {error_msg}", state="error")
 
     def update_projects(self, projects):
         """Update the dashboard with projects data - alias for update_tasks for compatibility"""
-        self.update_tasks(projects)
-
-    def dummy_projects(self):
-        # Dummy data for demonstration
-        return [
-            {
-                'name': 'Project A', 
-                'tasks': [
-                    {'name': 'Design User Interface', 'estimated_hours': 3.5},
-                    {'name': 'Develop Frontend', 'estimated_hours': 5.0},
-                    {'name': 'Backend Integration', 'estimated_hours': 2.5},
-                ]
-            },
-            {
-                'name': 'Project B', 
-                'tasks': [
-                    {'name': 'QA Testing', 'estimated_hours': 2.0},
-                    {'name': 'Documentation', 'estimated_hours': 1.5},
-                    {'name': 'Client Presentation', 'estimated_hours': 1.0},
-                ]
-            },
-            {
-                'name': 'Project C', 
-                'tasks': [
-                    {'name': 'Research', 'estimated_hours': 4.0},
-                    {'name': 'Data Analysis', 'estimated_hours': 3.0},
-                ]
-            }
-        ]
+        self.update_tasks(APIService.group_by_project(projects))
@@ -1,11 +1,15 @@
 from PySide6.QtWidgets import QMainWindow, QStackedWidget, QMessageBox
-from .styles import WINDOW_STYLE
+from PySide6.QtNetwork import QNetworkInformation
+import logging
+from .styles import GLOBAL_STYLE
 from .auth_window import AuthWindow
 from .dashboard_window import DashboardWindow
 from .project_window import ProjectWindow
 from .timer_window import TimerWindow
 from .api_service import APIService
 
+logger = logging.getLogger("main_window")
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -17,125 +21,107 @@ class MainWindow(QMainWindow):
     def init_ui(self):
         self.setWindowTitle('Time Tracker')
         self.setGeometry(200, 200, 900, 700)
-        self.setStyleSheet(WINDOW_STYLE)
+        # One stylesheet for the whole app; child windows select into it by object name
+        self.setStyleSheet(GLOBAL_STYLE)
 
         # Create stacked widget to manage different windows
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
 
-        # Create and add windows
+        # Only the login screen is built up front; the other windows are created on first use
         self.auth_window = AuthWindow(api_service=self.api_service)
         self.auth_window.api_service = self.api_service  # Pass API service to auth window
-        
-        self.dashboard_window = DashboardWindow(api_service=self.api_service)
-        # Pass API service if dashboard window needs it
-        
-        self.project_window = ProjectWindow(api_service=self.api_service)
-        
         self.stacked_widget.addWidget(self.auth_window)
-        self.stacked_widget.addWidget(self.dashboard_window)
-        self.stacked_widget.addWidget(self.project_window)
+        self._dashboard_window = None
+        self._project_window = None
+        self.timer_window = None
 
         # Connect signals
         self.auth_window.login_successful.connect(self.show_dashboard_window)  # Changed to show dashboard after login
-        self.dashboard_window.task_clicked.connect(self.show_timer_window)
-        self.project_window.task_selected.connect(self.handle_task_selected)
+
+    @property
+    def dashboard_window(self):
+        """The dashboard, built and added to the stack the first time it is needed"""
+        if self._dashboard_window is None:
+            self._dashboard_window = DashboardWindow(api_service=self.api_service)
+            self._dashboard_window.task_clicked.connect(self.show_timer_window)
+            self.stacked_widget.addWidget(self._dashboard_window)
+        return self._dashboard_window
+
+    @property
+    def project_window(self):
+        """The project selection window, built and added to the stack the first time it is needed"""
+        if self._project_window is None:
+            self._project_window = ProjectWindow(api_service=self.api_service)
+            self._project_window.task_selected.connect(self.handle_task_selected)
+            self.stacked_widget.addWidget(self._project_window)
+        return self._project_window
 
     def setup_connections(self):
         """Set up signal connections for API service"""
         # Connect token expired signal to redirect to login
         self.api_service.token_expired.connect(self.handle_token_expired)
         self.api_service.logout_success.connect(self.show_login_window)
-        # Connect projects and tasks loaded signal to update dashboard
-        self.api_service.projects_and_tasks_loaded.connect(self.update_dashboard)
+        # Re-read MAC/IP addresses for timelogs when the network changes
+        if QNetworkInformation.loadDefaultBackend():
+            QNetworkInformation.instance().reachabilityChanged.connect(
+                lambda _reachability: self.api_service.invalidate_network_cache()
+            )
 
     def show_dashboard_window(self):
         """Show dashboard window and fetch tasks"""
-        print("Showing dashboard window and fetching tasks...")
-        # Fetch all projects and tasks for the employee
-        self.api_service.get_projects_and_tasks()
+        logger.debug("Showing dashboard window and fetching tasks")
+        # Show (and on first use, build) the dashboard before fetching so its slots are connected
         self.stacked_widget.setCurrentWidget(self.dashboard_window)
-        
-    def update_dashboard(self, projects_data):
-        """Update dashboard with fetched projects and tasks"""
-        print(f"Updating dashboard with {len(projects_data)} projects")
-        self.dashboard_window.update_projects(projects_data)
+        # Fetch all projects and tasks for the employee
+        self.api_service.run_async(self.api_service.get_projects_and_tasks)
         
     def show_project_window(self):
         # Optionally refresh projects here:
         self.stacked_widget.setCurrentWidget(self.project_window)
-        self.api_service.get_projects_and_tasks()
+        self.api_service.run_async(self.api_service.get_projects_and_tasks)
         
     def handle_task_selected(self, selection):
         """Handle when a task is selected in ProjectWindow and start timer."""
         project = selection.get('project')
         task = selection.get('task')
         
-        # Check if we already have a timer window in the stack
-        timer_windows = [
-            self.stacked_widget.widget(i) 
-            for i in range(self.stacked_widget.count()) 
-            if isinstance(self.stacked_widget.widget(i), TimerWindow)
-        ]
-        
-        # Remove old timer windows to prevent memory leaks
-        for old_timer in timer_windows:
-            self.stacked_widget.removeWidget(old_timer)
-            if hasattr(old_timer, 'deleteLater'):
-                old_timer.deleteLater()
-    
-        self.timer_window = TimerWindow(project_data={'project': project, 'task': task}, api_service=self.api_service)
-        # Connect the switch_task signal from timer window
-        self.timer_window.switch_task.connect(self.handle_switch_task)
-        self.timer_window.logout_requested.connect(self.logout_user)
-        self.stacked_widget.addWidget(self.timer_window)
-        self.stacked_widget.setCurrentWidget(self.timer_window)
+        self._show_new_timer_window({'project': project, 'task': task})
         # Optionally, call a start method on TimerWindow if needed
 
     def show_timer_window(self, project_data):
         """Show timer window for the selected task"""
-        print(f"Starting timer for {project_data}")
+        logger.debug("Starting timer for %s", project_data)
         
-        # Check if we already have a timer window in the stack
-        timer_windows = [
-            self.stacked_widget.widget(i) 
-            for i in range(self.stacked_widget.count()) 
-            if isinstance(self.stacked_widget.widget(i), TimerWindow)
-        ]
-        
-        # Remove old timer windows to prevent memory leaks
-        for old_timer in timer_windows:
-            self.stacked_widget.removeWidget(old_timer)
-            if hasattr(old_timer, 'deleteLater'):
-                old_timer.deleteLater()
-    
-        # Create new timer window
+        self._show_new_timer_window(project_data)
+        # Start the timer automatically
+        self.timer_window.start_timer()
+
+    def _show_new_timer_window(self, project_data):
+        """Replace the current timer window, if any, with a new one for project_data and show it"""
+        # Remove the old timer window to prevent memory leaks
+        if self.timer_window is not None:
+            self.stacked_widget.removeWidget(self.timer_window)
+            self.timer_window.deleteLater()
+
         self.timer_window = TimerWindow(project_data, api_service=self.api_service)
         # Connect the switch_task signal from timer window
         self.timer_window.switch_task.connect(self.handle_switch_task)
         self.timer_window.logout_requested.connect(self.logout_user)
         self.stacked_widget.addWidget(self.timer_window)
         self.stacked_widget.setCurrentWidget(self.timer_window)
-        # Start the timer automatically
-        self.timer_window.start_timer()
 
     def show_login_window(self):
         """Switch back to login window"""
-        # Reset auth window if necessary
-        self.auth_window = AuthWindow(api_service=self.api_service)
-        self.auth_window.api_service = self.api_service
-        self.auth_window.login_successful.connect(self.show_dashboard_window)  # Changed to show dashboard
-        
-        # Replace the old auth window with the new one
-        self.stacked_widget.removeWidget(self.stacked_widget.widget(0))
-        self.stacked_widget.insertWidget(0, self.auth_window)
+        # Reuse the existing auth window; rebuilding it left the old one connected to the API signals
+        self.auth_window.reset()
         
         # Switch to login window
         self.stacked_widget.setCurrentWidget(self.auth_window)
 
     def handle_switch_task(self):
         """Handle switch task request from timer window"""
-        print("Switching task - returning to dashboard")
+        logger.debug("Switching task - returning to dashboard")
         # Return to dashboard when switching tasks
         self.show_dashboard_window()
         
@@ -1,16 +1,59 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                               QComboBox, QPushButton, QFrame, QSpacerItem, QSizePolicy,
-                               QMessageBox)
-from PySide6.QtCore import Signal, Qt
-from .styles import WINDOW_STYLE, TITLE_STYLE, SUBTITLE_STYLE, TEXT_STYLE, OLIVE, PRIMARY, WHITE, SECONDARY, CARD_STYLE, SHADOW
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QFormLayout, QLabel, 
+                               QComboBox, QPushButton, QFrame, QListView,
+                               QMessageBox, QCompleter)
+from PySide6.QtCore import Signal, Qt, QStringListModel, QAbstractListModel, QModelIndex
 from .api_service import APIService
 
+
+class Project:
+    """Compact record of the project fields the selectors use; data keeps the API dict for task_selected"""
+    __slots__ = ('id', 'name', 'tasks', 'task_names', 'data')
+
+    def __init__(self, data):
+        self.id = data.get('id')
+        self.name = data.get('name')
+        self.tasks = data.get('tasks') or []
+        self.task_names = [t.get('name') or '' for t in self.tasks]
+        self.data = data
+
+    def __repr__(self):
+        return f"Project(id={self.id!r}, name={self.name!r})"
+
+
+class ProjectListModel(QAbstractListModel):
+    """Read-only list of Project records; names and ids are only read when the combo's view asks for them"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._projects = []
+
+    def set_projects(self, projects):
+        """Replace the listed projects with a single model reset"""
+        self.beginResetModel()
+        self._projects = list(projects or [])
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._projects)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        project = self._projects[index.row()]
+        # An editable combo shows and completes against EditRole
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return project.name
+        if role == Qt.ItemDataRole.UserRole:
+            return project.id
+        return None
+
+
 class  ProjectWindow(QWidget):
     task_selected = Signal(dict)  # Emits {'project': ..., 'task': ...}
 
     def __init__(self, api_service=None):
         super().__init__()
         self.projects = []  # List of projects, each with tasks
+        self._projects_by_id = {}  # project id -> Project, for lookups from project_combo's item data
         self.api_service = api_service or APIService.get_instance()
         self.init_ui()
         self.setup_connections()
@@ -18,7 +61,7 @@ class  ProjectWindow(QWidget):
     def init_ui(self):
         self.setWindowTitle('Time Tracker – Project Selection')
         self.setGeometry(300, 300, 520, 350)
-        self.setStyleSheet(WINDOW_STYLE)
+        # Styled by GLOBAL_STYLE on MainWindow through object names and "role" properties
 
         main_layout = QVBoxLayout()
         main_layout.setSpacing(24)
@@ -26,41 +69,47 @@ class  ProjectWindow(QWidget):
 
         # Title
         title = QLabel('Select Project & Task')
-        title.setStyleSheet(TITLE_STYLE)
+        title.setObjectName("projectTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(title)
         main_layout.addSpacing(10)
 
         # Selection container
-        from .styles import CARD_STYLE, PRIMARY, TEXT_STYLE
         selection_frame = QFrame()
-        selection_frame.setStyleSheet(CARD_STYLE)
-        selection_layout = QVBoxLayout()
-        selection_layout.setSpacing(18)
+        selection_frame.setObjectName("selectionCard")
+        # One form layout holds both label/combo rows, instead of a box layout per row
+        selection_layout = QFormLayout()
+        selection_layout.setVerticalSpacing(18)
         selection_layout.setContentsMargins(26, 26, 26, 26)
+        selection_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
 
         # Project selection
-        project_layout = QHBoxLayout()
         self.project_label = QLabel('Project:')
-        self.project_label.setStyleSheet(f"color: {PRIMARY}; font-size: 18px; font-weight: 700; letter-spacing: 0.5px;")
+        self.project_label.setProperty("role", "formLabel")
         self.project_combo = QComboBox()
         self.project_combo.setMinimumHeight(44)
-        self.project_combo.setStyleSheet('font-size: 16px; font-weight: 500;')
+        self.project_combo.setProperty("role", "selector")
+        # A model the combo reads on demand and a plain list view that only paints visible rows
+        self._project_model = ProjectListModel(self)
+        self.project_combo.setModel(self._project_model)
+        project_view = QListView(self.project_combo)
+        project_view.setUniformItemSizes(True)
+        self.project_combo.setView(project_view)
         self.project_combo.currentIndexChanged.connect(self.on_project_changed)
-        project_layout.addWidget(self.project_label)
-        project_layout.addWidget(self.project_combo, 1)
-        selection_layout.addLayout(project_layout)
+        self._add_typeahead(self.project_combo)
+        selection_layout.addRow(self.project_label, self.project_combo)
 
         # Task selection
-        task_layout = QHBoxLayout()
         self.task_label = QLabel('Task:')
-        self.task_label.setStyleSheet(f"color: {PRIMARY}; font-size: 18px; font-weight: 700; letter-spacing: 0.5px;")
+        self.task_label.setProperty("role", "formLabel")
         self.task_combo = QComboBox()
         self.task_combo.setMinimumHeight(44)
-        self.task_combo.setStyleSheet('font-size: 16px; font-weight: 500;')
-        task_layout.addWidget(self.task_label)
-        task_layout.addWidget(self.task_combo, 1)
-        selection_layout.addLayout(task_layout)
+        # One model for the window's lifetime; switching projects only swaps its string list
+        self._task_model = QStringListModel(self)
+        self.task_combo.setModel(self._task_model)
+        self.task_combo.setProperty("role", "selector")
+        self._add_typeahead(self.task_combo)
+        selection_layout.addRow(self.task_label, self.task_combo)
 
         selection_frame.setLayout(selection_layout)
         main_layout.addWidget(selection_frame)
@@ -70,76 +119,61 @@ class  ProjectWindow(QWidget):
         self.start_button = QPushButton('Start Tracking')
         self.start_button.setFixedHeight(46)
         self.start_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.start_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {SECONDARY};
-                color: {WHITE};
-                border: none;
-                border-radius: 12px;
-                padding: 12px;
-                font-weight: bold;
-                font-size: 18px;
-                letter-spacing: 0.8px;
-                min-height: 50px;
-            }}
-            QPushButton:hover {{
-                background-color: {PRIMARY};
-                color: white;
-                transform: scale(1.03);
-            }}
-            QPushButton:pressed {{
-                background-color: {OLIVE};
-                color: white;
-            }}
-        """)
+        self.start_button.setObjectName("startTrackingButton")
         self.task_combo.currentIndexChanged.connect(self.on_task_selected)
-        # self.start_button.clicked.connect(self.handle_start)  # No longer needed for starting
         main_layout.addWidget(self.start_button)
-        main_layout.addSpacerItem(QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Expanding))
+        main_layout.addStretch()
 
         self.setLayout(main_layout)
 
+    def _add_typeahead(self, combo):
+        """Let the user type to narrow a combo box down to the entries containing the typed text"""
+        combo.setEditable(True)
+        combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)  # typed text only filters, it is never added
+        completer = QCompleter(combo.model(), combo)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        combo.setCompleter(completer)
+
     def setup_connections(self):
         """Set up signal/slot connections for API service"""
-        self.api_service.projects_and_tasks_loaded.connect(self.on_projects_and_tasks_loaded)
-        self.api_service.projects_and_tasks_error.connect(self.on_projects_and_tasks_error)
-        
-    def on_projects_loaded(self, projects):
-        """Handler for when projects are loaded successfully"""
-        self.projects = projects
+        # Both are emitted from the thread pool (APIService.run_async); the slots touch widgets
+        # and show message boxes, so they must always be queued onto the GUI thread
+        self.api_service.projects_and_tasks_loaded.connect(self.on_projects_and_tasks_loaded, Qt.ConnectionType.QueuedConnection)
+        self.api_service.projects_and_tasks_error.connect(self.on_projects_and_tasks_error, Qt.ConnectionType.QueuedConnection)
         
-        if not projects:
-            QMessageBox.information(self, 'No Projects', 'No projects available. Please contact your administrator.')
-            return
-            
-        for project in projects:
-            self.project_combo.addItem(project['name'], project['id'])
-            
-        # Enable start button again
-        self.start_button.setEnabled(True)
-        
-        # Load tasks for the first project
-        self.load_tasks()
-
     def on_projects_and_tasks_loaded(self, projects_with_tasks):
         """Handle loaded projects and their tasks (single API call)."""
+        # Cache hits, 304s and unchanged polls repeat the list shown; keep the user's selection as is
+        if projects_with_tasks is self.projects or projects_with_tasks == self.projects:
+            return
         self.projects = projects_with_tasks
-        self.project_combo.clear()
-        for project in self.projects:
-            self.project_combo.addItem(project['name'], project['id'])
+        records = [Project(p) for p in self.projects]
+        self._projects_by_id = {p.id: p for p in records}
+        # Swap the list in with one model reset, silently, then load the tasks of the selected project once
+        self.project_combo.blockSignals(True)
+        self._project_model.set_projects(records)
+        self.project_combo.setCurrentIndex(0 if self.projects else -1)
+        self.project_combo.blockSignals(False)
         if self.projects:
-            self.load_tasks_for_project(self.projects[0]['id'])
+            self.on_project_changed(self.project_combo.currentIndex())
 
     def on_projects_and_tasks_error(self, error_msg):
         QMessageBox.warning(self, 'Error', error_msg)
 
     def load_tasks_for_project(self, project_id):
         """Populate tasks for the selected project from already fetched data."""
-        self.task_combo.clear()
-        selected_project = next((p for p in self.projects if p['id'] == project_id), None)
-        if selected_project and 'tasks' in selected_project:
-            for task in selected_project['tasks']:
-                self.task_combo.addItem(task['name'], task['id'])
+        project = self._projects_by_id.get(project_id)
+        task_names = project.task_names if project is not None else []
+        # Swap the list in silently; the combo re-selects row 0 during the reset on its own
+        self.task_combo.blockSignals(True)
+        self._task_model.setStringList(task_names)
+        self.task_combo.setCurrentIndex(0 if task_names else -1)
+        self.task_combo.blockSignals(False)
+        if task_names:
+            # The first task is selected without a change signal; report it as adding items used to
+            self.on_task_selected(self.task_combo.currentIndex())
         self.start_button.setEnabled(True)
 
     def on_project_changed(self, index):
@@ -147,65 +181,14 @@ class  ProjectWindow(QWidget):
             return
         project_id = self.project_combo.itemData(index)
         self.load_tasks_for_project(project_id)
-        # Optionally, auto-select the first task when project changes
-        if self.task_combo.count() > 0:
-            self.task_combo.setCurrentIndex(0)
 
     def on_task_selected(self, task_index):
         if task_index < 0 or self.project_combo.currentIndex() < 0:
             return
-        project_index = self.project_combo.currentIndex()
-        project = self.projects[project_index]
-        if not project or 'tasks' not in project or task_index >= len(project['tasks']):
-            return
-        task = project['tasks'][task_index]
-        # Emit signal with both project and task info
-        self.task_selected.emit({'project': project, 'task': task})
-        
-        # Get current project ID
         project_id = self.project_combo.currentData()
-        self.api_service.get_tasks(project_id)
-        
-    def on_tasks_loaded(self, tasks):
-        """Handler for when tasks are loaded successfully"""
-        self.tasks = tasks
-        
-        if not tasks:
-            QMessageBox.information(self, 'No Tasks', 'No tasks available for this project.')
+        project = self._projects_by_id.get(project_id)
+        if project is None or task_index >= len(project.tasks):
             return
-            
-        for task in tasks:
-            self.task_combo.addItem(task['name'], task['id'])
-            
-        # Enable start button again
-        self.start_button.setEnabled(True)
-
-    def on_api_error(self, error_msg):
-        """Handler for API errors"""
-        QMessageBox.warning(self, 'Error', error_msg)
-        self.start_button.setEnabled(True)
-
-    def handle_start(self):
-        """Handler for start button click"""
-        if self.project_combo.count() == 0 or self.task_combo.count() == 0:
-            QMessageBox.warning(self, 'Error', 'Please select both a project and a task.')
-            return
-            
-        project_index = self.project_combo.currentIndex()
-        task_index = self.task_combo.currentIndex()
-        
-        if project_index < 0 or task_index < 0:
-            QMessageBox.warning(self, 'Error', 'Please select both a project and a task.')
-            return
-        
-        project_id = self.project_combo.currentData()
-        task_id = self.task_combo.currentData()
-        
-        selected_data = {
-            'project_id': project_id,
-            'project_name': self.project_combo.currentText(),
-            'task_id': task_id,
-            'task_name': self.task_combo.currentText()
-        }
-        
-        self.task_selected.emit(selected_data)
+        task = project.tasks[task_index]
+        # Emit signal with both project and task info
+        self.task_selected.emit({'project': project.data, 'task': task})
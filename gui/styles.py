@@ -184,7 +184,7 @@ DARK_WINDOW_STYLE = f"""
     }}
 """
 
-# Current active window style (default to light)
+# Light window style; widgets that follow the theme use get_style("WINDOW_STYLE") instead
 WINDOW_STYLE = LIGHT_WINDOW_STYLE
 
 # Light Mode Component Styles
@@ -213,7 +213,6 @@ LIGHT_CARD_STYLE = f"""
     padding: 20px;
     margin: 10px 0;
     border: 1px solid {LIGHT_PRIMARY};
-    box-shadow: {SHADOW};
 """
 
 LIGHT_GRADIENT_BUTTON = f"""
@@ -235,6 +234,27 @@ LIGHT_GRADIENT_BUTTON = f"""
     }}
 """
 
+# Text input style shared by the login form fields
+INPUT_STYLE = """
+    QLineEdit {
+        background: white;
+        border: 2px solid #e5e7eb;
+        border-radius: 10px;
+        padding: 12px 16px;
+        font-size: 17px;
+        color: #1E293B;
+        font-family: 'Segoe UI', 'Inter', 'Arial', sans-serif;
+    }
+    QLineEdit:focus {
+        border: 2px solid #1E40AF;
+        outline: none;
+    }
+    QLineEdit::placeholder {
+        color: #94A3B8;
+        font-size: 16px;
+    }
+"""
+
 # Dark Mode Component Styles
 DARK_TITLE_STYLE = f"""
     font-size: 32px;
@@ -261,7 +281,6 @@ DARK_CARD_STYLE = f"""
     padding: 20px;
     margin: 10px 0;
     border: 1px solid {DARK_MODE_BORDER};
-    box-shadow: {DARK_SHADOW};
 """
 
 DARK_GRADIENT_BUTTON = f"""
@@ -283,35 +302,289 @@ DARK_GRADIENT_BUTTON = f"""
     }}
 """
 
-# Current active component styles (default to light)
+# Light component styles; widgets that follow the theme use get_style(name) instead
 TITLE_STYLE = LIGHT_TITLE_STYLE
 SUBTITLE_STYLE = LIGHT_SUBTITLE_STYLE
 TEXT_STYLE = LIGHT_TEXT_STYLE
 CARD_STYLE = LIGHT_CARD_STYLE
 GRADIENT_BUTTON = LIGHT_GRADIENT_BUTTON
 
+# Application stylesheet, applied once by MainWindow. Widgets opt in through their
+# objectName or a "role"/"state" dynamic property instead of calling setStyleSheet themselves.
+# Labels sitting on a header or card set a transparent background, or WINDOW_STYLE's QWidget
+# background would paint a box behind them.
+DASHBOARD_STYLE = f"""
+    QFrame#dashboardHeader {{
+        background: {LIGHT_PRIMARY};
+        border-bottom-left-radius: 20px;
+        border-bottom-right-radius: 20px;
+    }}
+    QLabel#dashboardLogo {{
+        background: transparent;
+        color: {PRIMARY};
+        font-size: 28px;
+        font-weight: bold;
+        letter-spacing: 0.8px;
+    }}
+    QLabel#dashboardUser {{
+        color: {PRIMARY};
+        font-size: 18px;
+        background-color: rgba(255, 255, 255, 0.2);
+        padding: 6px 12px;
+        border-radius: 15px;
+    }}
+    QLabel#dashboardTitle {{
+        {LIGHT_TITLE_STYLE}
+        background: transparent;
+        padding-bottom: 5px;
+        letter-spacing: 0.8px;
+    }}
+    QListView#taskList {{
+        border: none;
+        background-color: transparent;
+    }}
+    QLabel#dashboardMessage {{
+        background: transparent;
+        color: {OLIVE};
+        font-size: 18px;
+        margin: 50px 0;
+    }}
+    QLabel#dashboardMessage[state="error"] {{
+        color: red;
+        font-size: 16px;
+    }}
+"""
+
+FORM_LABEL_STYLE = f"""
+    QLabel[role="formLabel"] {{
+        background: transparent;
+        color: {PRIMARY};
+        font-size: 18px;
+        font-weight: 700;
+        letter-spacing: 0.5px;
+    }}
+    QComboBox[role="selector"] {{
+        font-size: 16px;
+        font-weight: 500;
+        combobox-popup: 0;
+    }}
+"""
+
+START_BUTTON_STYLE = f"""
+    QPushButton#startTrackingButton {{
+        background-color: {SECONDARY};
+        color: {WHITE};
+        border: none;
+        border-radius: 12px;
+        padding: 12px;
+        font-weight: bold;
+        font-size: 18px;
+        letter-spacing: 0.8px;
+        min-height: 50px;
+    }}
+    QPushButton#startTrackingButton:hover {{
+        background-color: {PRIMARY};
+        color: white;
+    }}
+    QPushButton#startTrackingButton:pressed {{
+        background-color: {OLIVE};
+        color: white;
+    }}
+"""
+
+PROJECT_SELECTION_STYLE = f"""
+    QLabel#projectTitle {{
+        {LIGHT_TITLE_STYLE}
+        background: transparent;
+    }}
+    QFrame#selectionCard {{
+        {LIGHT_CARD_STYLE}
+    }}
+""" + FORM_LABEL_STYLE + START_BUTTON_STYLE
+
+# Applied by TimerWindow on top of its own WINDOW_STYLE: rules in that widget-level sheet would
+# otherwise override these app-level ones (e.g. QLabel color) regardless of selector specificity
+TIMER_STYLE = f"""
+    QFrame#timerInfoCard {{
+        background-color: {WHITE};
+        border: 1px solid {LIGHT_PRIMARY};
+        border-radius: 12px;
+        padding: 20px;
+    }}
+    QLabel[role="infoHeading"] {{
+        font-size: 18px;
+        font-weight: 600;
+        color: {PRIMARY};
+        margin-bottom: 5px;
+    }}
+    QLabel[role="infoSubheading"] {{
+        font-size: 16px;
+        font-weight: 500;
+        color: {SECONDARY};
+        margin-bottom: 5px;
+    }}
+    QPushButton#startPauseButton {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {SECONDARY}, stop:1 {PRIMARY});
+        color: {WHITE};
+        border: none;
+        border-radius: 12px;
+        padding: 12px 24px;
+        font-size: 16px;
+        font-weight: bold;
+    }}
+    QPushButton#startPauseButton:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {TERTIARY}, stop:1 {SECONDARY});
+    }}
+    QPushButton#startPauseButton[state="running"] {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 {SECONDARY}, stop:1 {PRIMARY});
+    }}
+    QPushButton#startPauseButton[state="running"]:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 {PRIMARY}, stop:1 {SECONDARY});
+    }}
+    QPushButton#startPauseButton[state="paused"] {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {LIGHT_PRIMARY}, stop:1 {SECONDARY});
+        color: {PRIMARY};
+    }}
+    QPushButton#startPauseButton[state="paused"]:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {SECONDARY}, stop:1 {PRIMARY});
+    }}
+    QPushButton#startPauseButton:pressed {{
+        background: {DARK_PRIMARY};
+    }}
+"""
+
+# Per-widget sheets of the timer window, formatted once at import instead of on every window open
+TIMER_BACKGROUND_STYLE = f"""
+    QWidget {{
+        background-color: {WHITE};
+    }}
+"""
+
+TIMER_HEADER_STYLE = f"""
+    QFrame {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {PRIMARY}, stop:0.5 {SECONDARY}, stop:1 {TERTIARY});
+        border-radius: 16px;
+        min-height: 75px;
+    }}
+"""
+
+TIMER_TITLE_STYLE = f"""
+    font-size: 28px;
+    font-weight: 700;
+    color: {WHITE};
+    letter-spacing: 0.5px;
+"""
+
+LOGOUT_BUTTON_STYLE = f"""
+    QPushButton {{
+        background-color: rgba(255, 255, 255, 0.15);
+        color: {WHITE};
+        border: 1px solid {WHITE};
+        border-radius: 10px;
+        padding: 8px 15px;
+        font-size: 14px;
+        font-weight: 600;
+    }}
+    QPushButton:hover {{
+        background-color: rgba(255, 255, 255, 0.25);
+    }}
+    QPushButton:pressed {{
+        background-color: rgba(255, 255, 255, 0.1);
+    }}
+"""
+
+TIMER_FRAME_STYLE = f"""
+    QFrame {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                                 stop:0 {WHITE}, 
+                                 stop:1 {LIGHT_PRIMARY});
+        border-radius: 16px;
+        padding: 20px;
+    }}
+"""
+
+PROGRESS_BAR_STYLE = f"""
+    QProgressBar {{
+        border: none;
+        border-radius: 5px;
+        background-color: rgba(203, 213, 225, 0.3);
+        max-height: 8px;
+    }}
+    
+    QProgressBar::chunk {{
+        border-radius: 5px;
+        background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {PRIMARY}, stop:0.5 {SECONDARY}, stop:1 {TERTIARY});
+    }}
+"""
+
+TIMER_STATUS_STYLE = f"""
+    color: {DARK_GRAY};
+    font-size: 14px;
+"""
+
+SWITCH_BUTTON_STYLE = f"""
+    QPushButton {{
+        background-color: {WHITE};
+        color: {PRIMARY};
+        border: 2px solid {PRIMARY};
+        border-radius: 12px;
+        padding: 10px 20px;
+        font-size: 16px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: {LIGHT_PRIMARY};
+    }}
+    QPushButton:pressed {{
+        background-color: {LIGHT_PRIMARY};
+        border-color: {DARK_PRIMARY};
+        color: {DARK_PRIMARY};
+    }}
+    QPushButton:disabled {{
+        background-color: {WHITE};
+        color: {DARK_GRAY};
+        border-color: {DARK_GRAY};
+    }}
+"""
+
+GLOBAL_STYLE = LIGHT_WINDOW_STYLE + DASHBOARD_STYLE + PROJECT_SELECTION_STYLE
+
+# Style registry: the strings above, keyed by theme (dark?) and then by name
+STYLES = {
+    False: {
+        "WINDOW_STYLE": LIGHT_WINDOW_STYLE,
+        "TITLE_STYLE": LIGHT_TITLE_STYLE,
+        "SUBTITLE_STYLE": LIGHT_SUBTITLE_STYLE,
+        "TEXT_STYLE": LIGHT_TEXT_STYLE,
+        "CARD_STYLE": LIGHT_CARD_STYLE,
+        "GRADIENT_BUTTON": LIGHT_GRADIENT_BUTTON,
+        "CURRENT_BG": LIGHT_BG,
+        "CURRENT_TEXT": LIGHT_TEXT,
+    },
+    True: {
+        "WINDOW_STYLE": DARK_WINDOW_STYLE,
+        "TITLE_STYLE": DARK_TITLE_STYLE,
+        "SUBTITLE_STYLE": DARK_SUBTITLE_STYLE,
+        "TEXT_STYLE": DARK_TEXT_STYLE,
+        "CARD_STYLE": DARK_CARD_STYLE,
+        "GRADIENT_BUTTON": DARK_GRADIENT_BUTTON,
+        "CURRENT_BG": DARK_MODE_BG,
+        "CURRENT_TEXT": DARK_MODE_TEXT,
+    },
+}
+
+# Theme chosen by toggle_dark_mode; read by get_style() when no theme is given
+_dark_mode = False
+
+def get_style(name, dark=None):
+    """Look up a themed style string (e.g. "TITLE_STYLE"), by default for the current theme"""
+    if dark is None:
+        dark = _dark_mode
+    return STYLES[bool(dark)][name]
+
 # Function to toggle between light and dark mode
 def toggle_dark_mode(is_dark_mode):
-    global WINDOW_STYLE, TITLE_STYLE, SUBTITLE_STYLE, TEXT_STYLE, CARD_STYLE, GRADIENT_BUTTON
-    global CURRENT_BG, CURRENT_TEXT
-    
-    if is_dark_mode:
-        WINDOW_STYLE = DARK_WINDOW_STYLE
-        TITLE_STYLE = DARK_TITLE_STYLE
-        SUBTITLE_STYLE = DARK_SUBTITLE_STYLE
-        TEXT_STYLE = DARK_TEXT_STYLE
-        CARD_STYLE = DARK_CARD_STYLE
-        GRADIENT_BUTTON = DARK_GRADIENT_BUTTON
-        CURRENT_BG = DARK_MODE_BG
-        CURRENT_TEXT = DARK_MODE_TEXT
-    else:
-        WINDOW_STYLE = LIGHT_WINDOW_STYLE
-        TITLE_STYLE = LIGHT_TITLE_STYLE
-        SUBTITLE_STYLE = LIGHT_SUBTITLE_STYLE
-        TEXT_STYLE = LIGHT_TEXT_STYLE
-        CARD_STYLE = LIGHT_CARD_STYLE
-        GRADIENT_BUTTON = LIGHT_GRADIENT_BUTTON
-        CURRENT_BG = LIGHT_BG
-        CURRENT_TEXT = LIGHT_TEXT
-    
-    return WINDOW_STYLE
+    """Switch the theme that get_style() returns; widgets pick it up when they are next styled"""
+    global _dark_mode
+    _dark_mode = bool(is_dark_mode)
+    return get_style("WINDOW_STYLE")
@@ -1,16 +1,13 @@
 import time
 import os
 from datetime import datetime, timedelta
-import mss
-import threading
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QMessageBox, QFrame, QProgressBar)
 from PySide6.QtCore import QTimer, Signal, Qt, QPropertyAnimation, QEasingCurve, QSize, QRect, Property
 from PySide6.QtGui import QFont, QIcon, QColor, QPixmap, QKeySequence, QShortcut
-from .styles import (WINDOW_STYLE, TITLE_STYLE, SUBTITLE_STYLE, TEXT_STYLE, 
-                    PRIMARY, SECONDARY, TERTIARY, DARK_PRIMARY, LIGHT_PRIMARY,
-                    SUCCESS, WARNING, DANGER, INFO, WHITE, GRAY, DARK_GRAY, BLACK, 
-                    CARD_STYLE, SHADOW, GRADIENT_BUTTON)
+from .styles import (get_style, PRIMARY, SUCCESS, DARK_GRAY, TIMER_STYLE, TIMER_BACKGROUND_STYLE,
+                    TIMER_HEADER_STYLE, TIMER_TITLE_STYLE, LOGOUT_BUTTON_STYLE, TIMER_FRAME_STYLE,
+                    PROGRESS_BAR_STYLE, TIMER_STATUS_STYLE, SWITCH_BUTTON_STYLE)
 from .api_service import APIService
 from .constants import TIMELOG_INTERVAL_SECONDS, PROGRESS_BAR_FOR_SESSION
 
@@ -47,7 +44,6 @@ class PulsingLabel(QLabel):
                 font-weight: 700;
                 color: {PRIMARY};
                 letter-spacing: 4px;
-                text-shadow: 0 2px 8px rgba(99, 102, 241, 0.2);
                 opacity: {self._opacity};
             """)
     
@@ -64,7 +60,6 @@ class PulsingLabel(QLabel):
             font-weight: 700;
             color: {PRIMARY};
             letter-spacing: 4px;
-            text-shadow: 0 2px 8px rgba(99, 102, 241, 0.2);
         """)
 
 class TimerWindow(QWidget):
@@ -75,7 +70,6 @@ class TimerWindow(QWidget):
         super().__init__()
         self.project_data = project_data  # Should contain both project and task
         self.api_service = api_service or APIService.get_instance()
-        self.screenshot_timer = None
         self.timelog_timer = None
         self.timer_running = False
         self.elapsed_time = 0
@@ -99,26 +93,7 @@ class TimerWindow(QWidget):
             
             # Update button style and text
             self.start_pause_button.setText('Pause')
-            self.start_pause_button.setStyleSheet(f'''
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 {SECONDARY}, stop:1 {PRIMARY});
-                    color: {WHITE};
-                    border: none;
-                    border-radius: 12px;
-                    padding: 12px 24px;
-                    font-weight: bold;
-                    font-size: 16px;
-                    box-shadow: {SHADOW};
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 {PRIMARY}, stop:1 {SECONDARY});
-                    transform: translateY(-2px);
-                }}
-                QPushButton:pressed {{
-                    background: {DARK_PRIMARY};
-                    transform: translateY(1px);
-                }}
-            ''')
+            self._set_button_state("running")
             
             # Start pulsing effect for timer
             self.time_label.start_pulsing()
@@ -128,7 +103,7 @@ class TimerWindow(QWidget):
             
             # Disable the switch task button during active tracking
             self.switch_task_button.setEnabled(False)
-            self.status_label.setText("Tracking active")
+            self._set_status("Tracking active")
             self.status_icon.setPixmap(self._create_status_icon(SUCCESS))
             
             # Take initial screenshot and post first timelog
@@ -143,14 +118,7 @@ class TimerWindow(QWidget):
     def init_ui(self):
         self.setWindowTitle('Time Tracker – Timer')
         self.setGeometry(300, 300, 600, 650)
-        self.setStyleSheet(WINDOW_STYLE + f"""
-            QWidget {{
-                background-image: url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAADIAAAAyCAMAAAAp4XiDAAAAUVBMVEWFhYWDg4N3d3dtbW17e3t1dXWBgYGHh4d5eXlzc3OLi4ubm5uVlZWPj4+NjY19fX2JiYl/f39ra2uRkZGZmZlpaWmXl5dvb29xcXGTk5NnZ2c8TV1mAAAAG3RSTlNAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAvEOwtAAAFVklEQVR4XpWWB67c2BUFb3g557T/hRo9/WUMZHlgr4Bg8Z4qQgQJlHI4A8SzFVrapvmTF9O7dmYRFZ60YiBhJRCgh1FYhiLAmdvX0CzTOpNE77ME0Zty/nWWzchDtiqrmQDeuv3powQ5ta2eN0FY0InkqDD73lT9c9lEzwUNqgFHs9VQce3TVClFCQrSTfOiYkVJQBmpbq2L6iZavPnAPcoU0dSw0SUTqz/GtrGuXfbyyBniKykOWQWGqwwMA7QiYAxi+IlPdqo+hYHnUt5ZPfnsHJyNiDtnpJyayNBkF6cWoYGAMY92U2hXHF/C1M8uP/ZtYdiuj26UdAdQQSXQErwSOMzt/XWRWAz5GuSBIkwG1H3FabJ2OsUOUhGC6tK4EMtJO0ttC6IBD3kM0ve0tJwMdSfjZo+EEISaeTr9P3wYrGjXqyC1krcKdhMpxEnt5JetoulscpyzhXN5FRpuPHvbeQaKxFAEB6EN+cYN6xD7RYGpXpNndMmZgM5Dcs3YSNFDHUo2LGfZuukSWyUYirJAdYbF3MfqEKmjM+I2EfhA94iG3L7uKrR+GdWD73ydlIB+6hgref1QTlmgmbM3/LeX5GI1Ux1RWpgxpLuZ2+I+IjzZ8wqE4nilvQdkUdfhzI5QDWy+kw5Wgg2pGpeEVeCCA7b85BO3F9DzxB3cdqvBzWcmzbyMiqhzuYqtHRVG2y4x+KOlnyqla8AoWWpuBoYRxzXrfKuILl6SfiWCbjxoZJUaCBj1CjH7GIaDbc9kqBY3W/Rgjda1iqQcOJu2WW+76pZC9QG7M00dffe9hNnseupFL53r8F7YHSwJWUKP2q+k7RdsxyOB11n0xtOvnW4irMMFNV4H0uqwS5ExsmP9AxbDTc9JwgneAT5vTiUSm1E7BSflSt3bfa1tv8Di3R8n3Af7MNWzs49hmauE2wP+ttrq+AsWpFG2awvsuOqbipWHgtuvuaAE+A1Z/7gC9hesnr+7wqCwG8c5yAg3AL1fm8T9AZtp/bbJGwl1pNrE7RuOX7PeMRUERVaPpEs+yqeoSmuOlokqw49pgomjLeh7icHNlG19yjs6XXOMedYm5xH2YxpV2tc0Ro2jJfxC50ApuxGob7lMsxfTbeUv07TyYxpeLucEH1gNd4IKH2LAg5TdVhlCafZvpskfncCfx8pOhJzd76bJWeYFnFciwcYfubRc12Ip/ppIhA1/mSZ/RxjFDrJC5xifFjJpY2Xl5zXdguFqYyTR1zSp1Y9p+tktDYYSNflcxI0iyO4TPBdlRcpeqjK/piF5bklq77VSEaA+z8qmJTFzIWiitbnzR794USKBUaT0NTEsVjZqLaFVqJoPN9ODG70IPbfBHKK+/q/AWR0tJzYHRULOa4MP+W/HfGadZUbfw177G7j/OGbIs8TahLyynl4X4RinF793Oz+BU0saXtUHrVBFT/DnA3ctNPoGbs4hRIjTok8i+algT1lTHi4SxFvONKNrgQFAq2/gFnWMXgwffgYMJpiKYkmW3tTg3ZQ9Jq+f8XN+A5eeUKHWvJWJ2sgJ1Sop+wwhqFVijqWaJhwtD8MNlSBeWNNWTa5Z5kPZw5+LbVT99wqTdx29lMUH4OIG/D86ruKEauBjvH5xy6um/Sfj7ei6UUVk4AIl3MyD4MSSTOFgSwsH/QJWaQ5as7ZcmgBZkzjjU1UrQ74ci1gWBCSGHtuV1H2mhSnO3Wp/3fEV5a+4wz//6qy8JxjZsmxxy5+4w9CDNJY09T072iKG0EnOS0arEYgXqYnXcYHwjTtUNAcMelOd4xpkoqiTYICWFq0JSiPfPDQdnt+4/wuqcXY47QILbgAAAABJRU5ErkJggg==');
-                background-position: center;
-                background-size: auto;
-                background-color: {WHITE};
-            }}
-        """)
+        self.setStyleSheet(get_style("WINDOW_STYLE") + TIMER_STYLE + TIMER_BACKGROUND_STYLE)
 
         main_layout = QVBoxLayout()
         main_layout.setSpacing(25)
@@ -158,47 +126,17 @@ class TimerWindow(QWidget):
 
         # Header with enhanced gradient background
         header_frame = QFrame()
-        header_frame.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {PRIMARY}, stop:0.5 {SECONDARY}, stop:1 {TERTIARY});
-                border-radius: 16px;
-                min-height: 75px;
-                box-shadow: {SHADOW};
-            }}
-        """)
+        header_frame.setStyleSheet(TIMER_HEADER_STYLE)
         header_layout = QHBoxLayout(header_frame)
         
         title = QLabel('Time Tracking')
-        title.setStyleSheet(f"""
-            font-size: 28px;
-            font-weight: 700;
-            color: {WHITE};
-            letter-spacing: 0.5px;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);
-        """)
+        title.setStyleSheet(TIMER_TITLE_STYLE)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         self.logout_button = QPushButton("Logout")
         self.logout_button.setFixedWidth(100)
         self.logout_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.logout_button.setStyleSheet(f'''
-            QPushButton {{
-                background-color: rgba(255, 255, 255, 0.15);
-                color: {WHITE};
-                border: 1px solid {WHITE};
-                border-radius: 10px;
-                padding: 8px 15px;
-                font-size: 14px;
-                font-weight: 600;
-                transition: all 0.2s;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(255, 255, 255, 0.25);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(255, 255, 255, 0.1);
-            }}
-        ''')
+        self.logout_button.setStyleSheet(LOGOUT_BUTTON_STYLE)
         self.logout_button.clicked.connect(self.handle_logout)  # Connect logout button to handler
         
         header_layout.addWidget(self.logout_button)
@@ -209,34 +147,16 @@ class TimerWindow(QWidget):
         
         # Project and Task Information Card
         info_frame = QFrame()
-        info_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {WHITE};
-                border: 1px solid {LIGHT_PRIMARY};
-                border-radius: 12px;
-                padding: 20px;
-                box-shadow: {SHADOW};
-            }}
-        """)
+        info_frame.setObjectName("timerInfoCard")
         info_layout = QVBoxLayout(info_frame)
         
         # Project info
         project_label = QLabel(f"Project: {self.project_data.get('project_name', 'Unknown Project')}")
-        project_label.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: 600;
-            color: {PRIMARY};
-            margin-bottom: 5px;
-        """)
+        project_label.setProperty("role", "infoHeading")
         
         # Task info
         task_label = QLabel(f"Task: {self.project_data.get('task_name', 'Unknown Task')}")
-        task_label.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: 500;
-            color: {SECONDARY};
-            margin-bottom: 5px;
-        """)
+        task_label.setProperty("role", "infoSubheading")
         
         info_layout.addWidget(project_label)
         info_layout.addWidget(task_label)
@@ -245,16 +165,7 @@ class TimerWindow(QWidget):
         
         # Timer Display
         timer_frame = QFrame()
-        timer_frame.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                                         stop:0 {WHITE}, 
-                                         stop:1 {LIGHT_PRIMARY});
-                border-radius: 16px;
-                padding: 20px;
-                box-shadow: {SHADOW};
-            }}
-        """)
+        timer_frame.setStyleSheet(TIMER_FRAME_STYLE)
         timer_layout = QVBoxLayout(timer_frame)
         
         self.time_label = PulsingLabel("00:00:00")
@@ -266,19 +177,7 @@ class TimerWindow(QWidget):
         self.progress_bar.setValue(0)
         self.progress_bar.setFixedHeight(10)
         self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                border-radius: 5px;
-                background-color: rgba(203, 213, 225, 0.3);
-                max-height: 8px;
-            }}
-            
-            QProgressBar::chunk {{
-                border-radius: 5px;
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {PRIMARY}, stop:0.5 {SECONDARY}, stop:1 {TERTIARY});
-            }}
-        """)
+        self.progress_bar.setStyleSheet(PROGRESS_BAR_STYLE)
         
         # Status indicator
         status_row = QHBoxLayout()
@@ -287,10 +186,7 @@ class TimerWindow(QWidget):
         self.status_icon.setPixmap(self._create_status_icon(DARK_GRAY))
         
         self.status_label = QLabel("Ready to start")
-        self.status_label.setStyleSheet(f"""
-            color: {DARK_GRAY};
-            font-size: 14px;
-        """)
+        self.status_label.setStyleSheet(TIMER_STATUS_STYLE)
         
         status_row.addWidget(self.status_icon)
         status_row.addWidget(self.status_label)
@@ -307,52 +203,12 @@ class TimerWindow(QWidget):
         
         self.start_pause_button = QPushButton("Start")
         self.start_pause_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.start_pause_button.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {SECONDARY}, stop:1 {PRIMARY});
-                color: {WHITE};
-                border: none;
-                border-radius: 12px;
-                padding: 12px 24px;
-                font-size: 16px;
-                font-weight: bold;
-                box-shadow: {SHADOW};
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {TERTIARY}, stop:1 {SECONDARY});
-            }}
-            QPushButton:pressed {{
-                background: {DARK_PRIMARY};
-            }}
-        """)
+        self.start_pause_button.setObjectName("startPauseButton")  # styled by TIMER_STYLE per "state"
         self.start_pause_button.clicked.connect(self.toggle_timer)  # Connect the button to toggle_timer
         
         self.switch_task_button = QPushButton("Switch Task")
         self.switch_task_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.switch_task_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {WHITE};
-                color: {PRIMARY};
-                border: 2px solid {PRIMARY};
-                border-radius: 12px;
-                padding: 10px 20px;
-                font-size: 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {LIGHT_PRIMARY};
-            }}
-            QPushButton:pressed {{
-                background-color: {LIGHT_PRIMARY};
-                border-color: {DARK_PRIMARY};
-                color: {DARK_PRIMARY};
-            }}
-            QPushButton:disabled {{
-                background-color: {WHITE};
-                color: {DARK_GRAY};
-                border-color: {DARK_GRAY};
-            }}
-        """)
+        self.switch_task_button.setStyleSheet(SWITCH_BUTTON_STYLE)
         self.switch_task_button.clicked.connect(self.handle_switch_task)  # Connect switch task button to handler
         
         button_layout.addWidget(self.switch_task_button)
@@ -367,7 +223,38 @@ class TimerWindow(QWidget):
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_timer)
         self.timer.setInterval(1000)  # Update every second
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)  # ~5% slack lets the OS batch the wakeup
         
+        # Periodic screenshot/timelog timer; parented so it stops with the window
+        self.screenshot_timer = QTimer(self)
+        self.screenshot_timer.timeout.connect(self.take_screenshot_and_post_timelog)
+        self.screenshot_timer.setInterval(self.screenshot_interval * 1000)  # Convert seconds to milliseconds
+        self.screenshot_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)  # whole-second accuracy is plenty here
+
+        # Status label writes are buffered in _pending_status and flushed once per interval
+        self._pending_status = self.status_label.text()
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+    def _set_status(self, text):
+        """Show text in the status label; writes within one flush interval are coalesced into a single repaint"""
+        self._pending_status = text
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """Write the latest pending status text to the label"""
+        self.status_label.setText(self._pending_status)
+
+    def _set_button_state(self, state):
+        """Switch the start/pause button's look through its "state" property instead of a new stylesheet"""
+        self.start_pause_button.setProperty("state", state)
+        # Dynamic properties are only re-read on polish
+        self.start_pause_button.style().unpolish(self.start_pause_button)
+        self.start_pause_button.style().polish(self.start_pause_button)
+
     def setup_shortcuts(self):
         """Setup keyboard shortcuts for common actions"""
         # Shortcut for Start/Pause - Space bar
@@ -384,11 +271,14 @@ class TimerWindow(QWidget):
         
     def _animate_progress_bar(self):
         """Animate progress bar when value changes"""
-        if hasattr(self, 'progress_animation'):
-            self.progress_animation.stop()
-            
         # Calculate the percentage of elapsed time relative to session goal
         progress_percentage = min(int((self.elapsed_time / self.session_goal) * 100), 100)
+
+        # The percentage only moves every session_goal / 100 seconds; skip the per-tick animation otherwise
+        if hasattr(self, 'progress_animation'):
+            if self.progress_animation.endValue() == progress_percentage:
+                return
+            self.progress_animation.stop()
             
         self.progress_animation = QPropertyAnimation(self.progress_bar, b"value")
         self.progress_animation.setDuration(300)
@@ -429,11 +319,14 @@ class TimerWindow(QWidget):
         
     def setup_connections(self):
         """Set up signal/slot connections for API service"""
-        self.api_service.screenshot_posted.connect(self.on_screenshot_success)
-        self.api_service.screenshot_error.connect(self.on_api_error)
-        self.api_service.timelog_posted.connect(self.on_timelog_success)
-        self.api_service.timelog_error.connect(self.on_api_error)
-        self.api_service.token_expired.connect(self.handle_token_expired)
+        # Timelog and screenshot results are emitted from the thread pool (APIService.run_async);
+        # the slots update widgets, so they must always be queued onto the GUI thread
+        queued = Qt.ConnectionType.QueuedConnection
+        self.api_service.screenshot_posted.connect(self.on_screenshot_success, queued)
+        self.api_service.screenshot_error.connect(self.on_api_error, queued)
+        self.api_service.timelog_posted.connect(self.on_timelog_success, queued)
+        self.api_service.timelog_error.connect(self.on_api_error, queued)
+        self.api_service.token_expired.connect(self.handle_token_expired, queued)
 
     def handle_token_expired(self):
         """Handle logout request."""
@@ -449,14 +342,12 @@ class TimerWindow(QWidget):
             os.makedirs(self.screenshots_folder)
 
     def check_screenshot_permission(self):
-        try:
-            with mss.mss() as sct:
-                sct.shot(output=os.path.join(self.screenshots_folder, 'permission_test.png'))
-            
+        from utils.screenshot_utils import check_screenshot_permission  # imports mss/Pillow on first use
+        if check_screenshot_permission():
             # Send permission status to API
             self.api_service.check_screenshot_permission()
             return True
-        except Exception as e:
+        else:
             QMessageBox.warning(self, 'Warning', 
                               'Screenshot permission not granted. Please enable screen capture.')
             
@@ -472,16 +363,8 @@ class TimerWindow(QWidget):
                 # Get current timestamp
                 current_time = datetime.now()
                 
-                # Generate filename for screenshot
-                filename = os.path.join(
-                    self.screenshots_folder,
-                    f'screenshot_{current_time.strftime("%Y%m%d_%H%M%S")}.png'
-                )
-                
-                # Take the screenshot
-                with mss.mss() as sct:
-                    # Capture the whole screen
-                    sct.shot(output=filename)
+                # The screenshot itself is captured and encoded by post_timelog_with_screenshot
+                # on APIService's capture pool, so nothing is grabbed or written on the GUI thread
                 
                 # Calculate duration since start or last timelog
                 duration_seconds = (current_time - self.last_timelog_time).total_seconds()
@@ -494,7 +377,8 @@ class TimerWindow(QWidget):
                 self.last_timelog_time = current_time
                 
                 # Post to API
-                self.api_service.post_timelog_with_screenshot(
+                self.api_service.run_async(
+                    self.api_service.post_timelog_with_screenshot,
                     self.project_data.get('task_id', ''),
                     self.project_data.get('project_id', ''),
                     start_time.isoformat(),
@@ -502,15 +386,16 @@ class TimerWindow(QWidget):
                     int(duration_seconds)
                 )
                 
-                # Update status with animation
-                self.status_label.setText(f"Screenshot taken at {current_time.strftime('%H:%M:%S')}")
+                # Update status with animation; the screenshot is captured later by the API service,
+                # and on_screenshot_success / on_timelog_success report how the upload went
+                self._set_status(f"Timelog sent at {current_time.strftime('%H:%M:%S')}")
                 
-                # Flash effect to indicate screenshot was taken
+                # Flash effect to indicate the timelog was sent
                 self._flash_status()
                 
             except Exception as e:
-                self.status_label.setText(f"Failed to take screenshot: {str(e)}")
-                print(f"Failed to take screenshot: {e}")
+                self._set_status(f"Failed to send timelog: {str(e)}")
+                print(f"Failed to send timelog: {e}")
     
     def _flash_status(self):
         """Create a flash animation for the status label"""
@@ -558,10 +443,6 @@ class TimerWindow(QWidget):
 
     def start_periodic_tasks(self):
         """Start periodic screenshot and timelog tasks"""
-        # Create and start a timer for screenshots
-        self.screenshot_timer = QTimer()
-        self.screenshot_timer.timeout.connect(self.take_screenshot_and_post_timelog)
-        self.screenshot_timer.setInterval(self.screenshot_interval * 1000)  # Convert seconds to milliseconds
         self.screenshot_timer.start()
 
         # Initialize last timelog time
@@ -569,8 +450,7 @@ class TimerWindow(QWidget):
 
     def stop_periodic_tasks(self):
         """Stop periodic screenshot and timelog tasks"""
-        if self.screenshot_timer:
-            self.screenshot_timer.stop()
+        self.screenshot_timer.stop()
 
     def toggle_timer(self):
         """Toggle timer between start and pause states"""
@@ -593,38 +473,20 @@ class TimerWindow(QWidget):
             
             # Update UI
             self.start_pause_button.setText('Resume')
-            self.start_pause_button.setStyleSheet(f'''
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {LIGHT_PRIMARY}, stop:1 {SECONDARY});
-                    color: {PRIMARY};
-                    border: none;
-                    border-radius: 12px;
-                    padding: 12px 24px;
-                    font-weight: bold;
-                    font-size: 16px;
-                    box-shadow: {SHADOW};
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {SECONDARY}, stop:1 {PRIMARY});
-                    transform: translateY(-2px);
-                }}
-                QPushButton:pressed {{
-                    background: {DARK_PRIMARY};
-                    transform: translateY(1px);
-                }}
-            ''')
+            self._set_button_state("paused")
             self.switch_task_button.setEnabled(True)  # Enable switch task when paused
             
             # Update status icon and text
             self.status_icon.setPixmap(self._create_status_icon("#F59E0B"))  # Yellow for paused
-            self.status_label.setText("Tracking paused")
+            self._set_status("Tracking paused")
             
             # Post final timelog for this session
             if self.start_time:
                 duration_seconds = (end_time - self.last_timelog_time).total_seconds()
                 
                 # Post to API
-                self.api_service.post_timelog_with_screenshot(
+                self.api_service.run_async(
+                    self.api_service.post_timelog_with_screenshot,
                     self.project_data.get('task_id', ''),
                     self.project_data.get('project_id', ''),
                     self.last_timelog_time.isoformat(),
@@ -677,8 +539,8 @@ class TimerWindow(QWidget):
     
     def on_screenshot_success(self):
         """Handle successful screenshot post."""
-        current_time = datetime.now().strftime('%H:%M:%S')
-        self.status_label.setText(f"Screenshot uploaded at {current_time}")
+        current_time = time.strftime('%H:%M:%S')
+        self._set_status(f"Screenshot uploaded at {current_time}")
         
         # Clean up screenshots that are older than 5 minutes
         self.clean_up_screenshots()
@@ -718,12 +580,12 @@ class TimerWindow(QWidget):
     
     def on_timelog_success(self):
         """Handle successful timelog post."""
-        current_time = datetime.now().strftime('%H:%M:%S')
-        self.status_label.setText(f"Time logged at {current_time}")
+        current_time = time.strftime('%H:%M:%S')
+        self._set_status(f"Time logged at {current_time}")
     
     def on_api_error(self, error_message):
         """Handle API error."""
-        self.status_label.setText(f"Error: {error_message}")
+        self._set_status(f"Error: {error_message}")
         
     def closeEvent(self, event):
         """Handle window close event."""
@@ -741,6 +603,9 @@ class TimerWindow(QWidget):
         )
         
         if confirm == QMessageBox.StandardButton.Yes:
+            # check_screenshot_permission may have opened an mss instance on this (GUI) thread
+            from utils.screenshot_utils import close_grabber
+            close_grabber()
             event.accept()
         else:
             event.ignore()
@@ -1,9 +1,17 @@
 import sys
+import logging
 from PySide6.QtWidgets import QApplication
 from gui.main_window import MainWindow
+from gui.api_service import APIService
+from gui.constants import BASE_URL, TIMELOG_INTERVAL_SECONDS
 
 def main():
+    logging.getLogger("main").info(
+        "Using API at %s, timelog interval %ss", BASE_URL, TIMELOG_INTERVAL_SECONDS
+    )
     app = QApplication(sys.argv)
+    # Release the screenshot threads' capture handles on the way out
+    app.aboutToQuit.connect(APIService.get_instance().shutdown)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
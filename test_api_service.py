@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Tests for APIService.
+They run without network access: HTTP responses are replaced by canned ones.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from gui import api_service
+from gui.api_service import APIService, coalesce_inflight
+
+TASKS_URL = f"{api_service.BASE_URL}/api/employees/tasks"
+
+TASKS = [
+    {'id': 11, 'name': 'Wireframes', 'project_id': 1, 'project_name': 'Website'},
+    {'id': 21, 'name': 'Login screen', 'project_id': 2, 'project_name': 'Mobile App'},
+]
+
+class FakeResponse:
+    """Just enough of requests.Response for APIService"""
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.content = json.dumps(payload).encode() if payload is not None else b''
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+@contextmanager
+def temporary_cache_dir():
+    """Point the on-disk task list cache at a throwaway directory"""
+    real_dir = api_service.DISK_CACHE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        api_service.DISK_CACHE_DIR = tmp
+        try:
+            yield tmp
+        finally:
+            api_service.DISK_CACHE_DIR = real_dir
+
+def replay(api, responses):
+    """Answer api's requests with the given responses in order; returns the list of sent headers"""
+    sent = []
+    pending = list(responses)
+
+    def fake_request(method, url, prepare=None, headers=None, **kwargs):
+        sent.append(dict(headers or {}))
+        return pending.pop(0)
+
+    api._request_with_refresh = fake_request
+    return sent
+
+def make_service():
+    """Return a logged-in APIService whose system lookups are already cached"""
+    api = APIService()
+    api.access_token = 'token'
+    api.user_id = 7
+    now = time.monotonic()
+    api._system_info_cache = {
+        'screenshot_permission': (now, True),
+        'mac_address': (now, '00:11:22:33:44:55'),
+        'ip_address': (now, '10.0.0.2'),
+    }
+    return api
+
+def test_skipped_capture_is_posted_without_screenshot_permission():
+    """While a previous capture holds the slot, the timelog goes out without a file and says so"""
+    api = make_service()
+    posted = []
+
+    def fake_request(method, url, prepare=None, **kwargs):
+        posted.append(prepare()['data'].fields)
+        return FakeResponse(201)
+
+    api._request_with_refresh = fake_request
+    assert api._capture_slot.acquire(blocking=False)
+    try:
+        assert api.post_timelog_with_screenshot(1, 2, 1700000000, 1700000300, 300) is True
+    finally:
+        api._capture_slot.release()
+
+    assert len(posted) == 1
+    fields = posted[0]
+    assert 'file' not in fields
+    assert fields['is_screenshot_permission_enabled'] == 'False'
+    assert fields['duration'] == '300'
+
+def test_expired_entry_is_revalidated_with_etag():
+    """A stale cache entry is sent back with If-None-Match, and a 304 reuses the cached payload"""
+    with temporary_cache_dir():
+        api = make_service()
+        loaded = []
+        api.projects_and_tasks_loaded.connect(loaded.append)
+        sent = replay(api, [FakeResponse(200, TASKS, {'ETag': '"v1"'}), FakeResponse(304)])
+
+        first = api.get_projects_and_tasks()
+        assert first == TASKS
+        assert 'If-None-Match' not in sent[0]
+
+        # Within the TTL the memory cache answers without a request
+        assert api.get_projects_and_tasks() is first
+        assert len(sent) == 1
+
+        api._cache[TASKS_URL] = (float('-inf'), first)  # let the entry expire
+        assert api.get_projects_and_tasks() is first
+        assert sent[1]['If-None-Match'] == '"v1"'
+        assert api._cached_get(TASKS_URL) is first  # the 304 restarted the TTL
+        assert loaded == [first, first, first]
+
+def test_304_after_invalidation_refetches():
+    """A 304 arriving after the cache was invalidated (e.g. by a timelog post) triggers a full GET"""
+    with temporary_cache_dir():
+        api = make_service()
+        replay(api, [FakeResponse(200, TASKS, {'ETag': '"v1"'})])
+        api.get_projects_and_tasks()
+        api._cache[TASKS_URL] = (float('-inf'), TASKS)
+
+        updated = [dict(TASKS[0], name='Wireframes v2')]
+        sent = []
+        pending = [FakeResponse(304), FakeResponse(200, updated, {'ETag': '"v2"'})]
+
+        def fake_request(method, url, prepare=None, headers=None, **kwargs):
+            sent.append(dict(headers or {}))
+            if len(sent) == 1:
+                api.invalidate_cache()  # another thread drops the cache mid-request
+            return pending.pop(0)
+
+        api._request_with_refresh = fake_request
+        assert api.get_projects_and_tasks() == updated
+        assert sent[0]['If-None-Match'] == '"v1"'
+        assert 'If-None-Match' not in sent[1]
+        assert api._cached_get(TASKS_URL) == updated
+
+def test_disk_cache_round_trip():
+    """A saved task list is shown at the next login and revalidated with its ETag"""
+    with temporary_cache_dir():
+        api = make_service()
+        replay(api, [FakeResponse(200, TASKS, {'ETag': '"v1"'})])
+        api.get_projects_and_tasks()
+
+        restarted = make_service()
+        loaded = []
+        restarted.projects_and_tasks_loaded.connect(loaded.append)
+        sent = replay(restarted, [FakeResponse(304)])
+        assert restarted.get_projects_and_tasks() == TASKS
+        assert sent[0]['If-None-Match'] == '"v1"'
+        assert loaded == [TASKS, TASKS]  # the saved list first, then the revalidated one
+
+def test_disk_copy_is_not_shown_after_a_timelog_post():
+    """Once a timelog invalidated the task totals, neither the next fetch nor the next login shows the old copy"""
+    with temporary_cache_dir():
+        api = make_service()
+        replay(api, [FakeResponse(200, TASKS, {'ETag': '"v1"'}), FakeResponse(201)])
+        api.get_projects_and_tasks()
+        assert api._capture_slot.acquire(blocking=False)  # no capture needed for this test
+        try:
+            assert api.post_timelog_with_screenshot(11, 1, 1700000000, 1700000300, 300) is True
+        finally:
+            api._capture_slot.release()
+
+        updated = [dict(TASKS[0], task_spent_time_in_minutes_real=5)]
+        loaded = []
+        api.projects_and_tasks_loaded.connect(loaded.append)
+        sent = replay(api, [FakeResponse(200, updated)])
+        assert api.get_projects_and_tasks() == updated
+        assert loaded == [updated]
+        assert 'If-None-Match' not in sent[0]
+
+        # Logging out and back in does not bring the pre-post copy back either
+        api.logout()
+        api.access_token, api.user_id = 'token', 7
+        loaded.clear()
+        replay(api, [FakeResponse(200, updated)])
+        api.get_projects_and_tasks()
+        assert loaded == [updated, updated]  # the saved post-timelog list, then the fresh one
+
+def test_corrupt_disk_cache_is_ignored():
+    """Unreadable or malformed cache files fall back to a normal request"""
+    for content in ('{"etag": "v1", "data": [', '[1, 2, 3]', '{"etag": "v1"}'):
+        with temporary_cache_dir():
+            api = make_service()
+            with open(api._disk_cache_path(), 'w', encoding='utf-8') as f:
+                f.write(content)
+            assert api._load_disk_cache(TASKS_URL) is None
+            assert TASKS_URL not in api._cache
+
+            sent = replay(api, [FakeResponse(200, TASKS)])
+            assert api.get_projects_and_tasks() == TASKS
+            assert 'If-None-Match' not in sent[0]
+            # The good response replaced the corrupt file
+            with open(api._disk_cache_path(), encoding='utf-8') as f:
+                assert json.load(f)['data'] == TASKS
+
+def test_disk_cache_is_per_user():
+    """Another user's saved list is never shown"""
+    with temporary_cache_dir() as tmp:
+        api = make_service()
+        replay(api, [FakeResponse(200, TASKS)])
+        api.get_projects_and_tasks()
+
+        other = make_service()
+        other.user_id = 8
+        assert other._load_disk_cache(TASKS_URL) is None
+        assert os.listdir(tmp) == ['projects_cache_7.json']
+
+class SlowService:
+    """Minimal owner of the attributes coalesce_inflight relies on"""
+    def __init__(self):
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self.calls = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    @coalesce_inflight
+    def fetch(self, key):
+        self.calls.append(key)
+        self.entered.set()
+        self.release.wait(5)
+        return [key]
+
+def test_coalesce_inflight_shares_one_call():
+    """Identical concurrent calls run once and share the result; other arguments run separately"""
+    service = SlowService()
+    results = []
+    leader = threading.Thread(target=lambda: results.append(service.fetch('a')))
+    leader.start()
+    assert service.entered.wait(5)
+
+    followers = [threading.Thread(target=lambda: results.append(service.fetch('a'))) for _ in range(3)]
+    for follower in followers:
+        follower.start()
+    time.sleep(0.2)  # let the followers reach the shared future
+    service.release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert service.calls == ['a']
+    assert len(results) == 4 and all(r is results[0] for r in results)
+    assert service._inflight == {}
+
+    # Once finished, the same call runs again, and different arguments never share
+    assert service.fetch('a') == ['a'] and service.fetch('b') == ['b']
+    assert service.calls == ['a', 'a', 'b']
+
+def test_coalesce_inflight_propagates_errors():
+    """A failing call raises to its caller and leaves no in-flight entry behind"""
+    class Failing(SlowService):
+        @coalesce_inflight
+        def fetch(self, key):
+            raise ValueError(key)
+
+    service = Failing()
+    try:
+        service.fetch('a')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+    assert service._inflight == {}
+
+if __name__ == "__main__":
+    test_skipped_capture_is_posted_without_screenshot_permission()
+    test_expired_entry_is_revalidated_with_etag()
+    test_304_after_invalidation_refetches()
+    test_disk_cache_round_trip()
+    test_disk_copy_is_not_shown_after_a_timelog_post()
+    test_corrupt_disk_cache_is_ignored()
+    test_disk_cache_is_per_user()
+    test_coalesce_inflight_shares_one_call()
+    test_coalesce_inflight_propagates_errors()
+    print("All API service tests passed")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the dashboard's TaskListModel.
+Runs headless (offscreen Qt platform) and without network access.
+"""
+
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+from gui.dashboard_window import Task, TaskListModel, _flatten_groups
+
+app = QApplication.instance() or QApplication([])
+
+def make_groups(minutes=0):
+    """Two projects with two tasks each"""
+    def task(task_id, name, project_id, project_name, spent=0):
+        return Task({'id': task_id, 'name': name, 'project_id': project_id, 'project_name': project_name,
+                     'task_spent_time_in_minutes_real': spent})
+    return [
+        ('Mobile App', [task(21, 'Login screen', 2, 'Mobile App', minutes), task(22, 'Push', 2, 'Mobile App')]),
+        ('Website', [task(11, 'Wireframes', 1, 'Website'), task(12, 'Mockups', 1, 'Website')]),
+    ]
+
+def record(model):
+    """Collect the model's structural and data-change notifications"""
+    events = []
+    model.rowsInserted.connect(lambda parent, first, last: events.append(('insert', first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: events.append(('remove', first, last)))
+    model.dataChanged.connect(lambda top, bottom, roles=None: events.append(('changed', top.row(), bottom.row())))
+    model.modelReset.connect(lambda: events.append(('reset',)))
+    return events
+
+def names(model):
+    """The DisplayRole text of every loaded row"""
+    return [model.index(row).data() for row in range(model.rowCount())]
+
+def test_set_rows_only_touches_changed_rows():
+    """Expanding, collapsing and updating times insert, remove or repaint just the affected rows"""
+    model = TaskListModel()
+    events = record(model)
+
+    model.set_groups(make_groups())
+    assert names(model) == ['Project: Mobile App', 'Project: Website']
+    assert events == [('insert', 0, 1)]
+
+    # Expanding the first project inserts its two tasks after its header, which is repainted
+    del events[:]
+    model.toggle_project('Mobile App')
+    assert names(model) == ['Project: Mobile App', 'Login screen', 'Push', 'Project: Website']
+    assert ('insert', 1, 2) in events
+    assert ('changed', 0, 0) in events
+    assert not any(e[0] in ('remove', 'reset') for e in events)
+
+    # New minutes on one task with unchanged ids only repaint that row
+    del events[:]
+    model.set_groups(make_groups(minutes=30))
+    assert events == [('changed', 1, 1)]
+    assert model.index(1).data(TaskListModel.MinutesRole) == 30
+
+    # Collapsing removes the task rows again
+    del events[:]
+    model.toggle_project('Mobile App')
+    assert names(model) == ['Project: Mobile App', 'Project: Website']
+    assert ('remove', 1, 2) in events
+    assert not any(e[0] in ('insert', 'reset') for e in events)
+
+def test_set_rows_matches_flattened_groups():
+    """Whatever the previous rows were, the model ends up with exactly the new flattened rows"""
+    model = TaskListModel()
+    model.toggle_project('Website')
+    model.set_groups(make_groups())
+    groups = make_groups()[::-1]  # projects in the other order
+    model.set_groups(groups)
+    assert model._rows == _flatten_groups(groups, {'Website'})
+
+if __name__ == "__main__":
+    test_set_rows_only_touches_changed_rows()
+    test_set_rows_matches_flattened_groups()
+    print("All dashboard window tests passed")
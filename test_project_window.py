@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the project/task selectors of ProjectWindow.
+Runs headless (offscreen Qt platform) and without network access.
+"""
+
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+from gui.api_service import APIService
+from gui.project_window import ProjectWindow
+
+app = QApplication.instance() or QApplication([])
+
+PROJECTS = [
+    {'id': 1, 'name': 'Website Redesign', 'tasks': [{'id': 11, 'name': 'Wireframes'},
+                                                    {'id': 12, 'name': 'Mockups'}]},
+    {'id': 2, 'name': 'Mobile App', 'tasks': [{'id': 21, 'name': 'Login screen'}]},
+]
+
+def make_window():
+    """Return a ProjectWindow on a private APIService, with a list of the emitted selections"""
+    window = ProjectWindow(api_service=APIService())
+    selections = []
+    window.task_selected.connect(selections.append)
+    return window, selections
+
+def test_project_combo_shows_and_completes_names():
+    """The editable project combo shows the selected name and completes on a substring"""
+    window, _ = make_window()
+    window.on_projects_and_tasks_loaded(PROJECTS)
+
+    assert window.project_combo.currentText() == 'Website Redesign'
+    assert window.project_combo.lineEdit().text() == 'Website Redesign'
+
+    completer = window.project_combo.completer()
+    completer.setCompletionPrefix('redes')
+    assert completer.completionCount() == 1
+    assert completer.currentCompletion() == 'Website Redesign'
+
+def test_first_task_is_reported_on_load_and_project_change():
+    """Loading projects and switching project both emit task_selected for the first task"""
+    window, selections = make_window()
+    window.on_projects_and_tasks_loaded(PROJECTS)
+    assert [(s['project']['id'], s['task']['id']) for s in selections] == [(1, 11)]
+
+    # A single-task project must be selectable without "changing" to its only task
+    window.project_combo.setCurrentIndex(1)
+    assert window.task_combo.currentText() == 'Login screen'
+    assert [(s['project']['id'], s['task']['id']) for s in selections] == [(1, 11), (2, 21)]
+
+    window.task_combo.setCurrentIndex(0)  # already selected: no duplicate emit
+    assert len(selections) == 2
+
+if __name__ == "__main__":
+    test_project_combo_shows_and_completes_names()
+    test_first_task_is_reported_on_load_and_project_change()
+    print("All project window tests passed")
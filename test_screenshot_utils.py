@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-thread mss instances of screenshot_utils.
+A counting stand-in replaces mss.mss(), so no display is needed.
+"""
+
+import threading
+from utils import screenshot_utils
+
+class FakeGrabber:
+    """Records whether close() was called"""
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+def test_grabbers_are_per_thread_and_closed_at_shutdown():
+    """Each thread gets one instance, and close_all_grabbers() releases those of finished threads"""
+    created = []
+    real_mss = screenshot_utils.mss.mss
+    screenshot_utils.mss.mss = lambda: created.append(FakeGrabber()) or created[-1]
+    try:
+        def capture_twice():
+            assert screenshot_utils.get_grabber() is screenshot_utils.get_grabber()
+
+        workers = [threading.Thread(target=capture_twice) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert len(created) == 3
+        assert not any(g.closed for g in created)
+
+        screenshot_utils.close_all_grabbers()
+        assert all(g.closed for g in created)
+
+        # A thread's own close_grabber() also drops it from the shutdown list
+        screenshot_utils.get_grabber()
+        screenshot_utils.close_grabber()
+        assert created[-1].closed and not screenshot_utils._open_grabbers
+    finally:
+        screenshot_utils.mss.mss = real_mss
+
+if __name__ == "__main__":
+    test_grabbers_are_per_thread_and_closed_at_shutdown()
+    print("All screenshot utils tests passed")